@@ -1,21 +1,56 @@
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+try:
+    from aoc.parsing import as_bytes, chunk_ranges, ints, map_file
+    from aoc.runner import map_day
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc.parsing import as_bytes, chunk_ranges, ints, map_file
+    from aoc.runner import map_day
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 'L68' -> '-68', 'R48' -> ' 48'
+_TURNS = bytes.maketrans(b'LR', b'- ')
+
+# Below this many rotations the plain loop beats NumPy's call overhead
+NUMPY_MIN_ROTATIONS = 1000
+
+# Largest byte range solve_file_parallel hands to one worker; parsing a
+# range takes several times its size in memory
+MAX_CHUNK_BYTES = 1 << 24
+
+
 def solve_safe_password(rotations, count_clicks=False):
     """
     Calculate the password by counting how many times the dial points at 0.
     
     Args:
-        rotations: List of rotation instructions (e.g., ["L68", "R48"])
+        rotations: Signed rotations, negative for left (e.g., [-68, 48])
         count_clicks: If True, count every time dial passes 0 during rotation,
                      not just when it ends on 0
     
     Returns:
         The number of times the dial points at 0
     """
+    # Any iterable works; only sized ones are worth handing to NumPy
+    if (np is not None and hasattr(rotations, '__len__')
+            and len(rotations) >= NUMPY_MIN_ROTATIONS):
+        return solve_safe_password_numpy(rotations, count_clicks)
+    
     position = 50  # Starting position
     count = 0
     
     for rotation in rotations:
-        direction = rotation[0]
-        distance = int(rotation[1:])
+        direction = 'L' if rotation < 0 else 'R'
+        distance = abs(rotation)
         
         if count_clicks:
             # Count how many times we click on 0 during the rotation
@@ -57,26 +92,422 @@ def solve_safe_password(rotations, count_clicks=False):
     return count
 
 
-# Example test case
-example_rotations = [
-    "L68", "L30", "R48", "L5", "R60",
-    "L55", "L1", "L99", "R14", "L82"
-]
+def solve_safe_password_numpy(rotations, count_clicks=False):
+    """
+    Vectorized ``solve_safe_password``; requires NumPy.
+    
+    The cumulative sum of the signed rotations gives the unwrapped dial
+    position after every rotation. A rotation from ``a`` to ``b`` ends on 0
+    if ``b`` is a multiple of 100, and clicks past 0 once for every multiple
+    of 100 in ``(a, b]`` when turning right, or in ``[b, a)`` when turning
+    left, which floor division counts without a loop.
+    """
+    steps = np.asarray(rotations, dtype=np.int64)
+    if len(steps) == 0:
+        return 0
+    
+    ends = np.cumsum(steps) + 50
+    if not count_clicks:
+        return int(np.count_nonzero(ends % 100 == 0))
+    
+    starts = np.concatenate(([50], ends[:-1]))
+    right = np.where(ends > starts, ends // 100 - starts // 100, 0)
+    left = np.where(ends < starts, (starts - 1) // 100 - (ends - 1) // 100, 0)
+    return int(right.sum() + left.sum())
 
-print("Example result:", solve_safe_password(example_rotations))
-print("Expected: 3")
 
-print("\nPart 2 Example result:", solve_safe_password(example_rotations, count_clicks=True))
-print("Expected: 6")
+class DialState(NamedTuple):
+    """Everything a Dial needs to resume: a snapshot can be stored as JSON."""
+    position: int
+    zeros: int
+    clicks: int
+    rotations: int
 
-# Try to load and solve the actual puzzle input if it exists
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_rotations = [line.strip() for line in f if line.strip()]
-        print(f"\nPart 1 answer: {solve_safe_password(puzzle_rotations)}")
-        print(f"Part 2 answer: {solve_safe_password(puzzle_rotations, count_clicks=True)}")
-        break
-else:
-    print("\nNo input file found. Add your puzzle input to solve the actual puzzle.")
+
+class Dial:
+    """
+    Safe dial that takes rotations one batch at a time.
+    
+    Only the current state is kept, so a log of any length can be fed
+    from a file, stdin or a socket in constant memory, and both answers
+    are available at any point:
+    
+        dial = Dial()
+        with open('input') as f:
+            dial.feed_lines(f)
+        dial.zeros   # part 1: rotations that ended on 0
+        dial.clicks  # part 2: clicks that passed over 0
+    
+    ``snapshot()`` and ``Dial.restore()`` checkpoint the state, so after
+    a restart processing resumes at rotation ``state.rotations`` instead
+    of replaying the log from the start.
+    """
+    
+    def __init__(self, position=50, zeros=0, clicks=0, rotations=0):
+        self.position = position
+        self.zeros = zeros
+        self.clicks = clicks
+        self.rotations = rotations
+    
+    def snapshot(self) -> DialState:
+        """Current state, to pass to ``Dial.restore`` later."""
+        return DialState(self.position, self.zeros, self.clicks, self.rotations)
+    
+    @classmethod
+    def restore(cls, state) -> 'Dial':
+        """Dial continuing from a snapshot (a DialState or a plain sequence)."""
+        return cls(*state)
+    
+    def feed(self, rotations: Iterable[int]) -> 'Dial':
+        """
+        Apply signed rotations, negative for left.
+        
+        A rotation from ``position`` to ``end`` clicks past 0 once for every
+        multiple of 100 in ``(position, end]`` turning right, or in
+        ``[end, position)`` turning left. The state is updated even if the
+        iterator fails part way through.
+        """
+        position, zeros, clicks, count = self.position, self.zeros, self.clicks, self.rotations
+        try:
+            for rotation in rotations:
+                end = position + rotation
+                if rotation >= 0:
+                    clicks += end // 100
+                else:
+                    clicks += (position - 1) // 100 - (end - 1) // 100
+                position = end % 100
+                if position == 0:
+                    zeros += 1
+                count += 1
+        finally:
+            self.position, self.zeros, self.clicks, self.rotations = position, zeros, clicks, count
+        return self
+    
+    def feed_lines(self, lines: Iterable) -> 'Dial':
+        """Apply rotation instructions such as ``"L68"``, one per line (str or bytes)."""
+        return self.feed(parse_rotation(line) for line in lines if line.strip())
+
+
+class StartSweep(NamedTuple):
+    """Answers for every starting position, indexed by that position."""
+    zeros: list
+    clicks: list
+
+
+def sweep_starts(rotations, modulus=100) -> StartSweep:
+    """
+    Part 1 and part 2 counts for every starting position in one pass.
+    
+    Write the running sum of the rotations as ``q * modulus + r``. From
+    start ``p`` the dial ends rotation ``k`` on 0 exactly when
+    ``r_k == -p (mod modulus)``, so part 1 for every start is a histogram
+    of the ``r_k``.
+    
+    Turning right from ``p + S_(k-1)`` to ``p + S_k`` passes
+    ``floor((p + S_k) / m) - floor((p + S_(k-1)) / m)`` multiples of the
+    modulus ``m``, which is ``q_k - q_(k-1)`` plus one for starts
+    ``p >= m - r_k`` and minus one for starts ``p >= m - r_(k-1)``.
+    Turning left passes the negation of that, corrected by one where
+    the rotation starts or ends on 0. Every rotation therefore adds a
+    constant plus two step functions of ``p``, which a difference array
+    accumulates in O(1), for O(n + modulus) overall.
+    
+    Args:
+        rotations: Signed rotations, negative for left
+        modulus: Number of positions on the dial
+    
+    Returns:
+        StartSweep whose ``zeros[p]`` and ``clicks[p]`` are the part 1 and
+        part 2 answers when the dial starts at ``p``
+    """
+    m = modulus
+    landed = [0] * m       # how often the running sum is r (mod m)
+    steps = [0] * (m + 1)  # difference array of the part 2 counts over p
+    corrections = [0] * m  # left turns starting or ending on 0
+    constant = 0
+    
+    total = 0
+    q, r = 0, 0
+    for rotation in rotations:
+        total += rotation
+        next_q, next_r = divmod(total, m)
+        if rotation >= 0:
+            constant += next_q - q
+            steps[m - next_r] += 1
+            steps[m - r] -= 1
+        else:
+            constant -= next_q - q
+            steps[m - next_r] -= 1
+            steps[m - r] += 1
+            corrections[-next_r % m] += 1
+            corrections[-r % m] -= 1
+        landed[next_r] += 1
+        q, r = next_q, next_r
+    
+    zeros = [landed[-p % m] for p in range(m)]
+    clicks = []
+    running = constant
+    for p in range(m):
+        running += steps[p]
+        clicks.append(running + corrections[p])
+    return StartSweep(zeros, clicks)
+
+
+def click_histogram(rotations, start=50, modulus=100) -> list:
+    """
+    How many clicks landed on each dial position over the whole log.
+    
+    Entry 0 is the part 2 answer; the other entries generalize it to
+    every position. A rotation of ``d`` clicks lands ``d // modulus``
+    times on every position, plus once on each position of a circular
+    run of ``d % modulus`` positions next to where it started. The full
+    turns are counted once and the runs are range-added into a
+    difference array, so the cost is O(n + modulus) however long the
+    rotations are.
+    """
+    m = modulus
+    steps = [0] * (m + 1)
+    full_turns = 0
+    position = start % m
+    for rotation in rotations:
+        turns, rest = divmod(abs(rotation), m)
+        full_turns += turns
+        if rest:
+            # Right lands on position+1 .. position+rest, left on position-rest .. position-1
+            first = (position + 1) % m if rotation > 0 else (position - rest) % m
+            last = first + rest
+            steps[first] += 1
+            if last <= m:
+                steps[last] -= 1
+            else:
+                steps[m] -= 1
+                steps[0] += 1
+                steps[last - m] -= 1
+        position = (position + rotation) % m
+    
+    histogram = []
+    running = full_turns
+    for p in range(m):
+        running += steps[p]
+        histogram.append(running)
+    return histogram
+
+
+class DialSummary(NamedTuple):
+    """
+    Effect of a stretch of rotations on the dial, for every entry position.
+    
+    ``offset`` is the net rotation; ``zeros[p]`` and ``clicks[p]`` are the
+    part 1 and part 2 counts of the stretch when the dial enters it at p.
+    """
+    offset: int
+    zeros: list
+    clicks: list
+
+
+def summarize(rotations, modulus=100) -> DialSummary:
+    """Summarize a stretch of rotations for every entry position."""
+    if not hasattr(rotations, '__len__'):  # two passes are needed
+        rotations = list(rotations)
+    sweep = sweep_starts(rotations, modulus)
+    return DialSummary(sum(rotations), sweep.zeros, sweep.clicks)
+
+
+def combine(first: DialSummary, second: DialSummary) -> DialSummary:
+    """
+    Summary of ``first`` followed by ``second``.
+    
+    Entering ``first`` at p means entering ``second`` at
+    ``p + first.offset``; the merge is associative, so summaries of
+    consecutive chunks can be computed independently and folded in order.
+    """
+    m = len(first.zeros)
+    shift = first.offset % m
+    return DialSummary(
+        first.offset + second.offset,
+        [first.zeros[p] + second.zeros[(p + shift) % m] for p in range(m)],
+        [first.clicks[p] + second.clicks[(p + shift) % m] for p in range(m)],
+    )
+
+
+class DialIndex:
+    """
+    Segment tree of DialSummary nodes over a rotation log.
+    
+    Answers "how many zero hits and zero passes do rotations i to j cause
+    when the dial is at p before rotation i" in O(log n) by walking the
+    O(log n) nodes covering the range from left to right, and supports
+    editing one rotation in O(modulus * log n):
+    
+        index = DialIndex(parse(input_text))
+        index.query(0, len(index), 50).zeros   # part 1
+        index.update(7, -12)                   # what if rotation 7 were L12?
+    
+    Every node keeps its counts for all entry positions, so the index
+    takes O(n * modulus) memory.
+    """
+    
+    def __init__(self, rotations, modulus=100):
+        rotations = list(rotations)
+        self.modulus = modulus
+        self.n = len(rotations)
+        self.size = 1
+        while self.size < max(1, self.n):
+            self.size *= 2
+        
+        identity = DialSummary(0, [0] * modulus, [0] * modulus)
+        self.nodes = [identity] * (2 * self.size)
+        for i, rotation in enumerate(rotations):
+            self.nodes[self.size + i] = summarize([rotation], modulus)
+        for node in range(self.size - 1, 0, -1):
+            self.nodes[node] = combine(self.nodes[2 * node], self.nodes[2 * node + 1])
+    
+    def __len__(self):
+        return self.n
+    
+    def update(self, i, rotation):
+        """Replace rotation ``i`` and refresh the nodes above it."""
+        if not 0 <= i < self.n:
+            raise IndexError(f"rotation {i} out of range")
+        node = self.size + i
+        self.nodes[node] = summarize([rotation], self.modulus)
+        node //= 2
+        while node:
+            self.nodes[node] = combine(self.nodes[2 * node], self.nodes[2 * node + 1])
+            node //= 2
+    
+    def query(self, i, j, start=50) -> DialState:
+        """
+        Apply rotations ``i`` up to (not including) ``j`` from position ``start``.
+        
+        Returns:
+            DialState with the final position and the zero hits and zero
+            passes caused by those rotations
+        """
+        if not 0 <= i <= j <= self.n:
+            raise IndexError(f"range [{i}, {j}) out of bounds for {self.n} rotations")
+        
+        left, right = [], []
+        lo, hi = i + self.size, j + self.size
+        while lo < hi:
+            if lo & 1:
+                left.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right.append(hi)
+            lo //= 2
+            hi //= 2
+        
+        position, zeros, clicks = start % self.modulus, 0, 0
+        for node in left + right[::-1]:
+            summary = self.nodes[node]
+            zeros += summary.zeros[position]
+            clicks += summary.clicks[position]
+            position = (position + summary.offset) % self.modulus
+        return DialState(position, zeros, clicks, j - i)
+
+
+def summarize_range(path, start, end, modulus=100) -> DialSummary:
+    """Summarize the rotations in bytes ``[start, end)`` of a file."""
+    with map_file(path) as mapped:
+        return summarize(parse(mapped[start:end]), modulus)
+
+
+def solve_file_parallel(path, workers=None, chunks=None, modulus=100, start=50):
+    """
+    Both answers for a rotation log file, using every core.
+    
+    The file is cut into byte ranges on line boundaries, each range is
+    summarized for every entry position in a worker process, and the
+    summaries are combined in file order. Ranges are at most
+    MAX_CHUNK_BYTES long, so memory per worker does not grow with the
+    file.
+    
+    Returns:
+        Tuple of (part 1, part 2) for a dial starting at ``start``
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    ranges = chunk_ranges(path, max(chunks or 4 * workers, -(-size // MAX_CHUNK_BYTES)))
+    if not ranges:
+        return 0, 0
+    
+    summaries = map_day(2025, 1, 'summarize_range',
+                        [(path, lo, hi, modulus) for lo, hi in ranges], workers)
+    total = next(summaries)
+    for summary in summaries:
+        total = combine(total, summary)
+    start %= modulus
+    return total.zeros[start], total.clicks[start]
+
+
+def parse_rotation(line) -> int:
+    """Parse one instruction such as ``"L68"`` into a signed distance."""
+    line = line.strip()
+    if isinstance(line, bytes):
+        line = line.decode()
+    distance = int(line[1:])
+    return -distance if line[0] == 'L' else distance
+
+
+def parse(input_text):
+    """Parse the rotation instructions into signed distances, left negative."""
+    return ints(as_bytes(input_text).translate(_TURNS), signed=True)
+
+
+def solve1(rotations):
+    """Count rotations that leave the dial pointing at 0."""
+    return solve_safe_password(rotations)
+
+
+def solve2(rotations):
+    """Count every click that passes the dial over 0."""
+    return solve_safe_password(rotations, count_clicks=True)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate a random rotation log ``scale`` times the size of the puzzle input.
+
+    The puzzle input has about 4,500 rotations, mostly shorter than one
+    full turn with the occasional one of several hundred clicks.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(max(1, round(4500 * scale))):
+        distance = rng.randint(1, 99) if rng.random() < 0.9 else rng.randint(100, 999)
+        lines.append(f"{rng.choice('LR')}{distance}")
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    # Example test case
+    example_rotations = parse("L68 L30 R48 L5 R60 L55 L1 L99 R14 L82")
+
+    print("Example result:", solve_safe_password(example_rotations))
+    print("Expected: 3")
+
+    print("\nPart 2 Example result:", solve_safe_password(example_rotations, count_clicks=True))
+    print("Expected: 6")
+
+    # Try to load and solve the actual puzzle input if it exists
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            # Stream the log through a Dial instead of loading it all at once
+            with open(filepath, 'r') as f:
+                dial = Dial().feed_lines(f)
+            print(f"\nPart 1 answer: {dial.zeros}")
+            print(f"Part 2 answer: {dial.clicks}")
+            break
+    else:
+        print("\nNo input file found. Add your puzzle input to solve the actual puzzle.")
@@ -1,3 +1,33 @@
+import bisect
+import heapq
+import mmap
+import os
+import random
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+
+try:
+    from aoc.runner import map_day
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc.runner import map_day
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INDEX_DIR = Path(__file__).resolve().parents[2] / '.cache' / 'd02'
+
+# Numbers per block of the sharded brute-force scan
+SCAN_BLOCK_SIZE = 1 << 20
+
+# Prefix sums of every invalid ID below 10^14 no longer fit in an int64
+MAX_INDEX_DIGITS = 13
+
+
 def is_invalid_id(num, part2=False):
     """
     Check if a number is invalid.
@@ -31,10 +61,13 @@ def is_invalid_id(num, part2=False):
         return False
 
 
-def find_invalid_ids_in_range(start, end, part2=False):
+def scan_invalid_ids_in_range(start, end, part2=False):
     """
-    Find all invalid IDs in the range [start, end].
+    Find all invalid IDs in the range [start, end] by checking every number.
     Returns a list of invalid IDs.
+
+    This is the reference implementation; its cost grows with the width
+    of the range.
     """
     invalid_ids = []
     
@@ -45,56 +78,424 @@ def find_invalid_ids_in_range(start, end, part2=False):
     return invalid_ids
 
 
-def solve(ranges_str, part2=False):
+def shard_range(start, end, block_size=SCAN_BLOCK_SIZE):
     """
-    Parse the input ranges and find all invalid IDs.
-    Returns the sum of all invalid IDs.
+    Cut [start, end] into blocks of at most ``block_size`` numbers.
+    Blocks never straddle a power of ten, so every number in a block has
+    the same number of digits.
+    Returns a list of (start, end) tuples.
+    """
+    blocks = []
+    start = max(start, 1)
+    while start <= end:
+        stop = min(end, start + block_size - 1, 10 ** len(str(start)) - 1)
+        blocks.append((start, stop))
+        start = stop + 1
+    return blocks
+
+
+def scan_block(start, end, part2=False):
+    """
+    Brute-force check of one block of same-length numbers.
+
+    With NumPy, each number is cut into ``period``-digit chunks with
+    ``%`` and ``//`` and the chunks are compared with the lowest one, a
+    whole block at a time. Without NumPy, or for numbers too long for
+    int64, it falls back to ``is_invalid_id`` per number.
+    """
+    length = len(str(start))
+    if np is None or length > 18:
+        return scan_invalid_ids_in_range(start, end, part2)
+    
+    nums = np.arange(start, end + 1, dtype=np.int64)
+    invalid = np.zeros(len(nums), dtype=bool)
+    for period in pattern_periods(length, part2):
+        base = 10 ** period
+        lowest = nums % base
+        repeated = np.ones(len(nums), dtype=bool)
+        rest = nums // base
+        for _ in range(length // period - 1):
+            repeated &= rest % base == lowest
+            rest //= base
+        invalid |= repeated
+    return nums[invalid].tolist()
+
+
+def scan_invalid_ids_parallel(start, end, part2=False, workers=None,
+                              block_size=SCAN_BLOCK_SIZE):
+    """
+    Reference brute-force scan of [start, end], sharded over processes.
+
+    Checks every number like ``scan_invalid_ids_in_range``, so it is
+    independent of the seed enumeration and closed-form sums it is used
+    to validate, but splits the range into blocks that are checked in a
+    process pool.
+    Returns a list of invalid IDs in ascending order.
+    """
+    blocks = shard_range(start, end, block_size)
+    if len(blocks) <= 1:
+        return [num for lo, hi in blocks for num in scan_block(lo, hi, part2)]
+    
+    results = map_day(2025, 2, 'scan_block', [(lo, hi, part2) for lo, hi in blocks], workers)
+    return [num for invalid_ids in results for num in invalid_ids]
+
+
+def repunit(length, period):
+    """
+    Multiplier that repeats a ``period``-digit seed to ``length`` digits.
+    e.g. repunit(6, 2) = 10101, and 10101 * 64 = 646464
+    """
+    return (10 ** length - 1) // (10 ** period - 1)
+
+
+def pattern_periods(length, part2=False):
+    """
+    Seed lengths whose repetitions make up ``length``-digit invalid IDs.
+    Part 1: only the half length
+    Part 2: every proper divisor of the length
+    """
+    if not part2:
+        return [length // 2] if length % 2 == 0 else []
+    return [period for period in range(1, length // 2 + 1) if length % period == 0]
+
+
+def iter_invalid_ids_in_range(start, end, part2=False):
+    """
+    Yield the invalid IDs in the range [start, end] in ascending order.
+
+    Instead of testing every number, generate the candidates: an invalid
+    ID of ``length`` digits is a ``period``-digit seed times
+    ``repunit(length, period)``, so the seeds in range form one
+    contiguous run per (length, period). Lengths follow each other in
+    order; within a length the runs are heap-merged, and a number like
+    111111, which is both 1x6 and 2x3, is yielded once.
+    """
+    if start > end:
+        return
+    start = max(start, 1)
+    
+    for length in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10 ** length - 1)
+        runs = []
+        for period in pattern_periods(length, part2):
+            multiplier = repunit(length, period)
+            first_seed = max(10 ** (period - 1), -(-low // multiplier))
+            last_seed = min(10 ** period - 1, high // multiplier)
+            runs.append(range(first_seed * multiplier, last_seed * multiplier + 1, multiplier))
+        if len(runs) == 1:
+            yield from runs[0]
+            continue
+        previous = None
+        for num in heapq.merge(*runs):
+            if num != previous:
+                yield num
+                previous = num
+
+
+def find_invalid_ids_in_range(start, end, part2=False):
+    """
+    Find all invalid IDs in the range [start, end], in ascending order.
+    Returns a list of invalid IDs.
+    """
+    return list(iter_invalid_ids_in_range(start, end, part2))
+
+
+def merge_ranges(ranges):
+    """
+    Sort ranges and merge the ones that overlap or touch.
+    Returns a list of disjoint (start, end) tuples in ascending order.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if start > end:
+            continue
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def iter_invalid_ids(ranges, part2=False):
+    """
+    Yield the invalid IDs of all ranges in ascending order, each once.
+
+    Overlapping ranges are merged first, so an ID covered by several
+    ranges is not repeated. Nothing is collected: memory stays constant
+    however many IDs the ranges hold.
+    """
+    for start, end in merge_ranges(ranges):
+        yield from iter_invalid_ids_in_range(start, end, part2)
+
+
+def prime_factors(n):
+    """Distinct prime factors of n, smallest first."""
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def sum_repeated(low, high, length, period):
+    """
+    Sum of the ``length``-digit numbers in [low, high] that repeat a
+    ``period``-digit seed, as an arithmetic series of seeds times the
+    repunit multiplier.
+    """
+    multiplier = repunit(length, period)
+    first_seed = max(10 ** (period - 1), -(-low // multiplier))
+    last_seed = min(10 ** period - 1, high // multiplier)
+    if first_seed > last_seed:
+        return 0
+    return multiplier * (first_seed + last_seed) * (last_seed - first_seed + 1) // 2
+
+
+def sum_invalid_ids_in_range(start, end, part2=False):
+    """
+    Sum the invalid IDs in the range [start, end] without listing them.
+
+    Part 1 is one arithmetic series per even length. In part 2 the
+    numbers with period p are exactly those whose period divides p, so
+    the union over all proper periods of a length is covered by the
+    periods length / q for each prime q dividing the length, and
+    inclusion-exclusion over products of those primes (the Moebius
+    function) removes the overlaps. The cost depends only on the number
+    of digits, so ranges up to 10^18 and beyond are exact.
+    """
+    if start > end:
+        return 0
+    start = max(start, 1)
+    total = 0
+    
+    for length in range(max(2, len(str(start))), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10 ** length - 1)
+        if not part2:
+            if length % 2 == 0:
+                total += sum_repeated(low, high, length, length // 2)
+            continue
+        primes = prime_factors(length)
+        for mask in range(1, 1 << len(primes)):
+            divisor = 1
+            for i, prime in enumerate(primes):
+                if mask >> i & 1:
+                    divisor *= prime
+            sign = 1 if bin(mask).count('1') % 2 else -1
+            total += sign * sum_repeated(low, high, length, length // divisor)
+    
+    return total
+
+
+class InvalidIdIndex:
+    """
+    Sorted invalid IDs up to ``digits`` digits, with their prefix sums.
+
+    The index is built once and saved as one int64 file: the IDs followed
+    by the running sums, starting at 0. Loading memory-maps that file, so
+    opening an index is instant and only the pages a query touches are
+    read. Each range query is two binary searches:
+
+        with InvalidIdIndex.open(part2=True) as index:
+            total = index.sum_ranges(ranges)
+    """
+
+    def __init__(self, path, digits, part2=False):
+        self.path = Path(path)
+        self.digits = digits
+        self.part2 = part2
+        self.limit = 10 ** digits - 1
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._values = memoryview(self._map).cast('q')
+        count = (len(self._values) - 1) // 2
+        self.ids = self._values[:count]
+        self.prefix = self._values[count:]
+
+    @staticmethod
+    def path_for(digits, part2=False, directory=INDEX_DIR):
+        return Path(directory) / f"invalid-p{2 if part2 else 1}-{digits}.bin"
+
+    @classmethod
+    def build(cls, digits, part2=False, directory=INDEX_DIR):
+        """Compute every invalid ID below 10^digits and save the index."""
+        if not 1 <= digits <= MAX_INDEX_DIGITS:
+            raise ValueError(f"digits must be between 1 and {MAX_INDEX_DIGITS}")
+        path = cls.path_for(digits, part2, directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        ids = array('q', find_invalid_ids_in_range(1, 10 ** digits - 1, part2))
+        prefix = array('q', accumulate(ids, initial=0))
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp, 'wb') as f:
+            ids.tofile(f)
+            prefix.tofile(f)
+        os.replace(temp, path)
+        return cls(path, digits, part2)
+
+    @classmethod
+    def open(cls, digits=10, part2=False, directory=INDEX_DIR):
+        """Load a saved index, building it first if there is none."""
+        path = cls.path_for(digits, part2, directory)
+        if not path.exists():
+            return cls.build(digits, part2, directory)
+        return cls(path, digits, part2)
+
+    def close(self):
+        self.ids.release()
+        self.prefix.release()
+        self._values.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _bounds(self, start, end):
+        if end > self.limit:
+            raise ValueError(f"{end} is beyond the {self.digits}-digit index")
+        return bisect.bisect_left(self.ids, start), bisect.bisect_right(self.ids, end)
+
+    def count(self, start, end):
+        """Number of invalid IDs in [start, end]."""
+        first, last = self._bounds(start, end)
+        return max(0, last - first)
+
+    def sum(self, start, end):
+        """Sum of the invalid IDs in [start, end]."""
+        first, last = self._bounds(start, end)
+        return self.prefix[last] - self.prefix[first] if first < last else 0
+
+    def sum_ranges(self, ranges):
+        """Sum of the invalid IDs over a batch of (start, end) ranges."""
+        return sum(self.sum(start, end) for start, end in ranges)
+
+
+def parse_ranges(ranges_str):
+    """
+    Parse the comma-separated ranges.
+    Returns a list of (start, end) tuples.
     """
-    # Parse the ranges
     ranges = []
     for range_str in ranges_str.strip().split(','):
         start, end = map(int, range_str.split('-'))
         ranges.append((start, end))
-    
-    # Find all invalid IDs across all ranges
-    all_invalid_ids = []
-    for start, end in ranges:
-        invalid_ids = find_invalid_ids_in_range(start, end, part2)
-        all_invalid_ids.extend(invalid_ids)
-    
-    return sum(all_invalid_ids)
+    return ranges
 
 
-# Test with the example
-example = """11-22,95-115,998-1012,1188511880-1188511890,222220-222224,
+def sum_invalid_ids(ranges, part2=False, method='enumerate'):
+    """
+    Find all invalid IDs across all ranges.
+    Returns the sum of all invalid IDs.
+
+    ``method`` is 'enumerate' to generate the invalid IDs and add them up,
+    'arithmetic' to sum them in closed form, 'index' to look them up in
+    the saved InvalidIdIndex covering the widest range or 'scan' to check
+    every number with the sharded brute force.
+    """
+    if method == 'scan':
+        return sum(sum(scan_invalid_ids_parallel(start, end, part2)) for start, end in ranges)
+    if method == 'arithmetic':
+        return sum(sum_invalid_ids_in_range(start, end, part2) for start, end in ranges)
+    if method == 'index':
+        digits = max((len(str(end)) for _, end in ranges), default=1)
+        with InvalidIdIndex.open(max(digits, 10), part2) as index:
+            return index.sum_ranges(ranges)
+    if method != 'enumerate':
+        raise ValueError(f"unknown method {method!r}")
+
+    return sum(sum(iter_invalid_ids_in_range(start, end, part2)) for start, end in ranges)
+
+
+def solve(ranges_str, part2=False, method='enumerate'):
+    """
+    Parse the input ranges and find all invalid IDs.
+    Returns the sum of all invalid IDs.
+    """
+    return sum_invalid_ids(parse_ranges(ranges_str), part2, method)
+
+
+def parse(input_text):
+    return parse_ranges(input_text)
+
+
+def solve1(ranges):
+    """Sum the IDs made of a sequence repeated exactly twice."""
+    return sum_invalid_ids(ranges)
+
+
+def solve2(ranges):
+    """Sum the IDs made of a sequence repeated at least twice."""
+    return sum_invalid_ids(ranges, part2=True)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate random ID ranges, ``scale`` times as many as the puzzle input.
+
+    The puzzle input has about 30 ranges of 1-10 digit IDs, each up to a
+    couple of hundred thousand IDs wide.
+    """
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(max(1, round(32 * scale))):
+        digits = rng.randint(1, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, min(200000, 10 ** digits))
+        ranges.append(f"{start}-{end}")
+    return ','.join(ranges) + '\n'
+
+
+if __name__ == '__main__':
+    # Test with the example
+    example = """11-22,95-115,998-1012,1188511880-1188511890,222220-222224,
 1698522-1698528,446443-446449,38593856-38593862,565653-565659,
 824824821-824824827,2121212118-2121212124"""
 
-print("Part 1 Example:")
-result = solve(example)
-print(f"Sum of invalid IDs: {result}")
-print(f"Expected: 1227775554")
-print()
+    print("Part 1 Example:")
+    result = solve(example)
+    print(f"Sum of invalid IDs: {result}")
+    print(f"Expected: 1227775554")
+    print()
 
-print("Part 2 Example:")
-result2 = solve(example, part2=True)
-print(f"Sum of invalid IDs: {result2}")
-print(f"Expected: 4174379265")
-print()
+    print("Part 2 Example:")
+    result2 = solve(example, part2=True)
+    print(f"Sum of invalid IDs: {result2}")
+    print(f"Expected: 4174379265")
+    print()
 
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_input = f.read()
-        print("Part 1 answer:")
-        answer1 = solve(puzzle_input)
-        print(f"Sum of invalid IDs: {answer1}")
-        print()
-        print("Part 2 answer:")
-        answer2 = solve(puzzle_input, part2=True)
-        print(f"Sum of invalid IDs: {answer2}")
-        break
-else:
-    print("No input file found.")
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Part 1 answer:")
+            answer1 = solve(puzzle_input)
+            print(f"Sum of invalid IDs: {answer1}")
+            print()
+            print("Part 2 answer:")
+            answer2 = solve(puzzle_input, part2=True)
+            print(f"Sum of invalid IDs: {answer2}")
+            break
+    else:
+        print("No input file found.")
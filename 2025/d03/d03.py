@@ -1,11 +1,86 @@
+import os
+import random
+import sys
+from itertools import islice
+from pathlib import Path
+
+try:
+    from aoc.parsing import chunk_ranges, map_file
+    from aoc.runner import map_day
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc.parsing import chunk_ranges, map_file
+    from aoc.runner import map_day
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The batched NumPy solver pays off from this many banks, and costs one
+# pass over the digit matrix per battery, so long selections stay with
+# the stack, which is linear in the bank length whatever the count
+NUMPY_MIN_BANKS = 16
+NUMPY_MAX_BATTERIES = 40
+
+# Files smaller than this are solved in-process by solve_file, which
+# reads this many banks at a time
+PARALLEL_MIN_BYTES = 1 << 24
+STREAM_BATCH_BANKS = 4096
+
+
+# int() refuses decimal strings longer than sys.get_int_max_str_digits()
+# (4300 by default), so longer selections are converted piecewise
+_MAX_INT_DIGITS = 4000
+
+
+def digits_to_int(digits):
+    """
+    Convert a string of decimal digits of any length to an int.
+    Long strings are split in half and recombined, which also keeps the
+    conversion well below quadratic time.
+    """
+    if len(digits) <= _MAX_INT_DIGITS:
+        return int(digits) if digits else 0
+    mid = len(digits) // 2
+    low = digits[mid:]
+    return digits_to_int(digits[:mid]) * 10 ** len(low) + digits_to_int(low)
+
+
+def select_batteries(bank, num_batteries=2):
+    """
+    Pick the largest ``num_batteries``-digit subsequence of a bank.
+
+    Monotonic stack: every digit pops the smaller digits before it as
+    long as enough digits remain to drop, so each battery is pushed and
+    popped at most once, O(n) for any number of batteries.
+
+    Returns:
+        The selected digits, in bank order, as a string (or as bytes
+        for a bytes bank)
+    """
+    k = num_batteries
+    if not 0 <= k <= len(bank):
+        raise ValueError(f"cannot select {k} batteries from a bank of {len(bank)}")
+    drop = len(bank) - k
+    stack = []
+    
+    for digit in bank:
+        while drop and stack and stack[-1] < digit:
+            stack.pop()
+            drop -= 1
+        stack.append(digit)
+    
+    if isinstance(bank, bytes):
+        return bytes(stack[:k])
+    return ''.join(stack[:k])
+
+
 def find_max_joltage(bank, num_batteries=2):
     """
     Find the maximum joltage possible from a bank by selecting
     exactly num_batteries batteries (maintaining their order).
     
-    Strategy: Greedily select batteries to maximize the resulting number.
-    At each position, choose to keep or skip the battery.
-    
     Args:
         bank: A string of digits representing battery joltages
         num_batteries: Number of batteries to select
@@ -13,108 +88,295 @@ def find_max_joltage(bank, num_batteries=2):
     Returns:
         The maximum joltage possible
     """
-    if num_batteries == 2:
-        # Optimized approach for 2 batteries
+    return digits_to_int(select_batteries(bank, num_batteries))
+
+
+class JoltageIndex:
+    """
+    Sparse table over one bank for choosing any number of batteries.
+
+    ``table[j][i]`` is the position of the leftmost largest digit in
+    ``bank[i:i + 2**j]``, so the greedy pick over any window is two
+    lookups. Built once in O(n log n), it answers every
+    ``num_batteries`` with O(1) work per selected battery, instead of a
+    fresh pass over the bank for each one:
+
+        index = JoltageIndex(bank)
+        joltages = [index.max_joltage(k) for k in range(1, len(bank) + 1)]
+    """
+
+    def __init__(self, bank):
+        self.bank = bank
+        level = list(range(len(bank)))
+        self.table = [level]
+        width = 1
+        while 2 * width <= len(bank):
+            level = [a if bank[a] >= bank[b] else b
+                     for a, b in zip(level, level[width:])]
+            self.table.append(level)
+            width *= 2
+
+    def argmax(self, start, stop):
+        """Position of the leftmost largest digit in bank[start:stop]."""
+        j = (stop - start).bit_length() - 1
+        a = self.table[j][start]
+        b = self.table[j][stop - (1 << j)]
+        return a if self.bank[a] >= self.bank[b] else b
+
+    def select(self, num_batteries):
+        """The largest ``num_batteries``-digit subsequence, as a string."""
+        bank = self.bank
         n = len(bank)
-        max_joltage = 0
+        k = num_batteries
+        if not 0 <= k <= n:
+            raise ValueError(f"cannot select {k} batteries from a bank of {n}")
+        picked = []
+        start = 0
         
-        for i in range(n - 1):
-            max_after = max(bank[i + 1:])
-            joltage = int(bank[i] + max_after)
-            max_joltage = max(max_joltage, joltage)
+        for i in range(k):
+            if n - start == k - i:
+                # Every remaining battery has to be used
+                picked.append(bank[start:])
+                break
+            pos = self.argmax(start, n - (k - i) + 1)
+            picked.append(bank[pos])
+            start = pos + 1
         
-        return max_joltage
-    
-    # For selecting k batteries from n positions to maximize the number
-    # We use a greedy approach: at each step, choose the largest digit
-    # that still allows us to select enough remaining batteries
-    n = len(bank)
+        return ''.join(picked)
+
+    def max_joltage(self, num_batteries):
+        """Same as ``find_max_joltage(bank, num_batteries)``."""
+        return digits_to_int(self.select(num_batteries))
+
+
+def max_joltage_all(bank):
+    """
+    Maximum joltage of a bank for every number of batteries.
+
+    Returns:
+        List whose entry k is ``find_max_joltage(bank, k)``, for k from 0
+        to len(bank)
+    """
+    index = JoltageIndex(bank)
+    return [index.max_joltage(k) for k in range(len(bank) + 1)]
+
+
+def total_joltage_numpy(banks, num_batteries=2):
+    """
+    Total joltage of many banks, selecting batteries for all of them at once.
+
+    Banks of equal length are stacked into one uint8 digit matrix. The
+    greedy pick of each battery is then a single argmax per row over the
+    window the row may still choose from: from just after its previous
+    pick up to the last position that leaves room for the batteries
+    still to come. argmax returns the leftmost maximum, which keeps the
+    most choice for later picks. The chosen digits are summed per
+    column and weighted by powers of ten as Python ints, so the total is
+    exact for any number of batteries.
+    """
     k = num_batteries
-    result = []
-    start = 0
+    by_length = {}
+    for bank in banks:
+        by_length.setdefault(len(bank), []).append(bank)
     
-    for i in range(k):
-        # We need to select k-i batteries starting from position start
-        # We must leave at least k-i-1 positions after our choice
-        best_digit = '0'
-        best_pos = start
+    total = 0
+    for n, group in by_length.items():
+        if not 0 <= k <= n:
+            raise ValueError(f"cannot select {k} batteries from a bank of {n}")
+        joined = b''.join(group) if isinstance(group[0], bytes) else ''.join(group).encode()
+        digits = np.frombuffer(joined, dtype=np.uint8).reshape(len(group), n)
+        digits = digits.astype(np.int8) - ord('0')
+        rows = np.arange(len(group))
+        columns = np.arange(n)
+        start = np.zeros(len(group), dtype=np.intp)
+        column_sums = []
         
-        # We can choose from positions start to n-(k-i)
-        for pos in range(start, n - (k - i) + 1):
-            if bank[pos] > best_digit:
-                best_digit = bank[pos]
-                best_pos = pos
+        for i in range(k):
+            window = digits[:, :n - k + i + 1]
+            masked = np.where(columns[:n - k + i + 1] >= start[:, None], window, -1)
+            best = masked.argmax(axis=1)
+            column_sums.append(int(digits[rows, best].sum(dtype=np.int64)))
+            start = best + 1
         
-        result.append(best_digit)
-        start = best_pos + 1
+        group_total = 0
+        for column_sum in column_sums:
+            group_total = group_total * 10 + column_sum
+        total += group_total
     
-    return int(''.join(result))
+    return total
 
 
-def solve(input_text, num_batteries=2):
+def total_joltage(banks, num_batteries=2):
     """
-    Calculate the total output joltage from all battery banks.
+    Calculate the total output joltage from a list of battery banks.
     
     Args:
-        input_text: Multi-line string where each line is a battery bank
+        banks: List of digit strings, one per battery bank
         num_batteries: Number of batteries to select from each bank
     
     Returns:
         The sum of maximum joltages from all banks
     """
-    lines = input_text.strip().split('\n')
+    if (np is not None and len(banks) >= NUMPY_MIN_BANKS
+            and num_batteries <= NUMPY_MAX_BATTERIES):
+        return total_joltage_numpy(banks, num_batteries)
+    
     total = 0
     
-    for bank in lines:
+    for bank in banks:
         max_joltage = find_max_joltage(bank, num_batteries)
         total += max_joltage
     
     return total
 
 
-# Test with the example
-example = """987654321111111
+def iter_banks(data, start=0, end=None):
+    """
+    Yield the banks in ``data[start:end]`` one line at a time, as bytes.
+    ``data`` may be a memory map; only the current line is copied out.
+    """
+    end = len(data) if end is None else end
+    while start < end:
+        stop = data.find(b'\n', start, end)
+        if stop == -1:
+            stop = end
+        bank = data[start:stop].rstrip(b'\r')
+        if bank:
+            yield bank
+        start = stop + 1
+
+
+def total_joltage_range(path, start, end, num_batteries=2):
+    """
+    Total joltage of the banks in bytes ``[start, end)`` of a file.
+    Banks are solved in batches of STREAM_BATCH_BANKS, so the batched
+    NumPy solver applies while memory stays bounded.
+    """
+    total = 0
+    with map_file(path) as mapped:
+        banks = iter_banks(mapped, start, end)
+        while batch := list(islice(banks, STREAM_BATCH_BANKS)):
+            total += total_joltage(batch, num_batteries)
+    return total
+
+
+def solve_file(path, num_batteries=2, workers=None, chunks=None):
+    """
+    Total joltage of a bank file, streamed from a memory map.
+    
+    Banks are read line by line as bytes, so memory stays constant
+    however large the file is. Files of at least PARALLEL_MIN_BYTES are
+    cut into byte ranges on line breaks and the ranges are solved in
+    worker processes.
+    """
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or size < PARALLEL_MIN_BYTES:
+        return total_joltage_range(path, 0, size, num_batteries)
+    
+    ranges = chunk_ranges(path, chunks or 4 * workers)
+    return sum(map_day(2025, 3, 'total_joltage_range',
+                       [(path, lo, hi, num_batteries) for lo, hi in ranges], workers))
+
+
+def solve(input_text, num_batteries=2):
+    """
+    Calculate the total output joltage from all battery banks.
+    
+    Args:
+        input_text: Multi-line string where each line is a battery bank,
+                    or the path of a bank file as a ``pathlib.Path`` (or
+                    other ``os.PathLike``), which is streamed by solve_file
+        num_batteries: Number of batteries to select from each bank
+    
+    Returns:
+        The sum of maximum joltages from all banks
+    """
+    if isinstance(input_text, os.PathLike):
+        return solve_file(input_text, num_batteries)
+    return total_joltage(parse(input_text), num_batteries)
+
+
+def parse(input_text):
+    """Split the input into one digit string per battery bank."""
+    return input_text.strip().split('\n')
+
+
+def solve1(banks):
+    """Total joltage when turning on two batteries per bank."""
+    return total_joltage(banks, 2)
+
+
+def solve2(banks):
+    """Total joltage when turning on twelve batteries per bank."""
+    return total_joltage(banks, 12)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate random battery banks, ``scale`` times as many as the puzzle input.
+
+    The puzzle input has 200 banks of 100 digits from 1 to 9.
+    """
+    rng = random.Random(seed)
+    banks = []
+    for _ in range(max(1, round(200 * scale))):
+        banks.append(''.join(rng.choice('123456789') for _ in range(100)))
+    return '\n'.join(banks) + '\n'
+
+
+if __name__ == '__main__':
+    # Test with the example
+    example = """987654321111111
 811111111111119
 234234234234278
 818181911112111"""
 
-print("Part 1 Example:")
-print("Bank 987654321111111 -> max joltage:", find_max_joltage("987654321111111", 2))
-print("Bank 811111111111119 -> max joltage:", find_max_joltage("811111111111119", 2))
-print("Bank 234234234234278 -> max joltage:", find_max_joltage("234234234234278", 2))
-print("Bank 818181911112111 -> max joltage:", find_max_joltage("818181911112111", 2))
-print()
-
-result = solve(example, 2)
-print(f"Total output joltage: {result}")
-print(f"Expected: 357")
-print()
-
-print("Part 2 Example:")
-print("Bank 987654321111111 -> max joltage:", find_max_joltage("987654321111111", 12))
-print("Bank 811111111111119 -> max joltage:", find_max_joltage("811111111111119", 12))
-print("Bank 234234234234278 -> max joltage:", find_max_joltage("234234234234278", 12))
-print("Bank 818181911112111 -> max joltage:", find_max_joltage("818181911112111", 12))
-print()
-
-result2 = solve(example, 12)
-print(f"Total output joltage: {result2}")
-print(f"Expected: 3121910778619")
-print()
-
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_input = f.read()
-        print("Part 1 Puzzle answer:")
-        answer1 = solve(puzzle_input, 2)
-        print(f"Total output joltage: {answer1}")
-        print()
-        print("Part 2 Puzzle answer:")
-        answer2 = solve(puzzle_input, 12)
-        print(f"Total output joltage: {answer2}")
-        break
-else:
-    print("No input file found.")
+    print("Part 1 Example:")
+    print("Bank 987654321111111 -> max joltage:", find_max_joltage("987654321111111", 2))
+    print("Bank 811111111111119 -> max joltage:", find_max_joltage("811111111111119", 2))
+    print("Bank 234234234234278 -> max joltage:", find_max_joltage("234234234234278", 2))
+    print("Bank 818181911112111 -> max joltage:", find_max_joltage("818181911112111", 2))
+    print()
+
+    result = solve(example, 2)
+    print(f"Total output joltage: {result}")
+    print(f"Expected: 357")
+    print()
+
+    print("Part 2 Example:")
+    print("Bank 987654321111111 -> max joltage:", find_max_joltage("987654321111111", 12))
+    print("Bank 811111111111119 -> max joltage:", find_max_joltage("811111111111119", 12))
+    print("Bank 234234234234278 -> max joltage:", find_max_joltage("234234234234278", 12))
+    print("Bank 818181911112111 -> max joltage:", find_max_joltage("818181911112111", 12))
+    print()
+
+    result2 = solve(example, 12)
+    print(f"Total output joltage: {result2}")
+    print(f"Expected: 3121910778619")
+    print()
+
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Part 1 Puzzle answer:")
+            answer1 = solve(puzzle_input, 2)
+            print(f"Total output joltage: {answer1}")
+            print()
+            print("Part 2 Puzzle answer:")
+            answer2 = solve(puzzle_input, 12)
+            print(f"Total output joltage: {answer2}")
+            break
+    else:
+        print("No input file found.")
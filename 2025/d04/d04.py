@@ -1,3 +1,5 @@
+import random
+
 # Directions for the 8 adjacent positions (including diagonals)
 DIRECTIONS = [
     (-1, -1), (-1, 0), (-1, 1),  # top-left, top, top-right
@@ -108,6 +110,19 @@ def count_removable_rolls(grid):
     return total_removed
 
 
+def parse_grid(input_text):
+    """
+    Parse the input into a grid.
+    
+    Args:
+        input_text: Multi-line string representing the grid
+    
+    Returns:
+        List of strings representing the grid
+    """
+    return [line.strip() for line in input_text.strip().split('\n') if line.strip()]
+
+
 def solve(input_text):
     """
     Parse the input and count accessible rolls.
@@ -118,8 +133,7 @@ def solve(input_text):
     Returns:
         The number of rolls that can be accessed
     """
-    grid = [line.strip() for line in input_text.strip().split('\n') if line.strip()]
-    return count_accessible_rolls(grid)
+    return count_accessible_rolls(parse_grid(input_text))
 
 
 def solve_part2(input_text):
@@ -132,12 +146,50 @@ def solve_part2(input_text):
     Returns:
         The total number of rolls that can be removed
     """
-    grid = [line.strip() for line in input_text.strip().split('\n') if line.strip()]
+    return count_removable_rolls(parse_grid(input_text))
+
+
+def parse(input_text):
+    return parse_grid(input_text)
+
+
+def solve1(grid):
+    """Number of rolls a forklift can access."""
+    return count_accessible_rolls(grid)
+
+
+def solve2(grid):
+    """Number of rolls removed by repeatedly clearing accessible ones."""
     return count_removable_rolls(grid)
 
 
-# Test with the example from the puzzle description
-example = """..@@.@@@@.
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate a random square grid with ``scale`` times the cells of the puzzle input.
+
+    The puzzle input is 139x139 with about 65% of the cells holding a roll.
+    """
+    rng = random.Random(seed)
+    side = max(1, round(139 * scale ** 0.5))
+    rows = []
+    for _ in range(side):
+        rows.append(''.join('@' if rng.random() < 0.65 else '.' for _ in range(side)))
+    return '\n'.join(rows) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    # Test with the example from the puzzle description
+    example = """..@@.@@@@.
 @@@.@.@.@@
 @@@@@.@.@@
 @.@@@@..@.
@@ -148,32 +200,31 @@ example = """..@@.@@@@.
 .@@@@@@@@.
 @.@.@@@.@."""
 
-print("Example (Part 1):")
-result = solve(example)
-print(f"Number of accessible rolls: {result}")
-print(f"Expected: 13")
-print()
-
-print("Example (Part 2):")
-result_part2 = solve_part2(example)
-print(f"Total removable rolls: {result_part2}")
-print(f"Expected: 43")
-print()
-
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    filepath = os.path.join(os.path.dirname(__file__), filename)
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            puzzle_input = f.read()
-        print("Part 1 answer:")
-        answer = solve(puzzle_input)
-        print(f"Number of accessible rolls: {answer}")
-        print()
-        print("Part 2 answer:")
-        answer_part2 = solve_part2(puzzle_input)
-        print(f"Total removable rolls: {answer_part2}")
-        break
-else:
-    print("No input file found.")
+    print("Example (Part 1):")
+    result = solve(example)
+    print(f"Number of accessible rolls: {result}")
+    print(f"Expected: 13")
+    print()
+
+    print("Example (Part 2):")
+    result_part2 = solve_part2(example)
+    print(f"Total removable rolls: {result_part2}")
+    print(f"Expected: 43")
+    print()
+
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(__file__), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Part 1 answer:")
+            answer = solve(puzzle_input)
+            print(f"Number of accessible rolls: {answer}")
+            print()
+            print("Part 2 answer:")
+            answer_part2 = solve_part2(puzzle_input)
+            print(f"Total removable rolls: {answer_part2}")
+            break
+    else:
+        print("No input file found.")
@@ -1,3 +1,14 @@
+import random
+import sys
+from pathlib import Path
+
+try:
+    from aoc.parsing import as_bytes, ints, rows
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc.parsing import as_bytes, ints, rows
+
+
 def parse_input(input_text):
     """
     Parse the database file into ranges and ingredient IDs.
@@ -8,18 +19,13 @@ def parse_input(input_text):
     Returns:
         Tuple of (ranges, ingredient_ids)
         - ranges: List of (start, end) tuples
-        - ingredient_ids: List of ingredient IDs to check
+        - ingredient_ids: array of ingredient IDs to check
     """
-    parts = input_text.strip().split('\n\n')
+    database = as_bytes(input_text).strip()
+    blank = database.find(b'\n\n')
     
-    # Parse ranges
-    ranges = []
-    for line in parts[0].split('\n'):
-        start, end = map(int, line.split('-'))
-        ranges.append((start, end))
-    
-    # Parse ingredient IDs
-    ingredient_ids = [int(line) for line in parts[1].split('\n')]
+    ranges = rows(ints(database[:blank]), 2)
+    ingredient_ids = ints(database[blank:])
     
     return ranges, ingredient_ids
 
@@ -41,20 +47,19 @@ def is_fresh(ingredient_id, ranges):
     return False
 
 
-def solve(input_text, part2=False):
+def count_fresh(ranges, ingredient_ids, part2=False):
     """
     Count how many of the available ingredient IDs are fresh (part 1),
     or count total fresh IDs in all ranges (part 2).
     
     Args:
-        input_text: The database file content
+        ranges: List of (start, end) tuples representing fresh ranges
+        ingredient_ids: List of ingredient IDs to check
         part2: If True, solve part 2; otherwise solve part 1
     
     Returns:
         Number of fresh ingredients (part 1) or total fresh IDs (part 2)
     """
-    ranges, ingredient_ids = parse_input(input_text)
-    
     if not part2:
         # Part 1: Count how many available ingredients are fresh
         fresh_count = 0
@@ -92,8 +97,67 @@ def solve(input_text, part2=False):
         return total
 
 
-# Test with the example
-example = """3-5
+def solve(input_text, part2=False):
+    """
+    Count how many of the available ingredient IDs are fresh (part 1),
+    or count total fresh IDs in all ranges (part 2).
+    
+    Args:
+        input_text: The database file content
+        part2: If True, solve part 2; otherwise solve part 1
+    
+    Returns:
+        Number of fresh ingredients (part 1) or total fresh IDs (part 2)
+    """
+    ranges, ingredient_ids = parse_input(input_text)
+    return count_fresh(ranges, ingredient_ids, part2)
+
+
+def parse(input_text):
+    return parse_input(input_text)
+
+
+def solve1(database):
+    """Number of available ingredient IDs that are fresh."""
+    ranges, ingredient_ids = database
+    return count_fresh(ranges, ingredient_ids)
+
+
+def solve2(database):
+    """Number of IDs covered by the fresh ranges."""
+    ranges, ingredient_ids = database
+    return count_fresh(ranges, ingredient_ids, part2=True)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate a random database ``scale`` times the size of the puzzle input.
+
+    The puzzle input has about 190 fresh ranges of IDs up to 5 * 10^14,
+    each up to 10^13 wide, followed by 1,000 ingredient IDs.
+    """
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(max(1, round(190 * scale))):
+        start = rng.randint(1, 5 * 10 ** 14)
+        ranges.append(f"{start}-{start + rng.randint(0, 10 ** 13)}")
+    ingredient_ids = [str(rng.randint(1, 5 * 10 ** 14)) for _ in range(max(1, round(1000 * scale)))]
+    return '\n'.join(ranges) + '\n\n' + '\n'.join(ingredient_ids) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    # Test with the example
+    example = """3-5
 10-14
 16-20
 12-18
@@ -105,41 +169,41 @@ example = """3-5
 17
 32"""
 
-print("Example:")
-ranges, ids = parse_input(example)
-print(f"Ranges: {ranges}")
-print(f"Ingredient IDs: {ids}")
-print()
-
-for id_val in ids:
-    fresh = is_fresh(id_val, ranges)
-    print(f"Ingredient ID {id_val}: {'fresh' if fresh else 'spoiled'}")
-print()
-
-result = solve(example)
-print(f"Total fresh ingredients: {result}")
-print(f"Expected: 3")
-print()
-
-print("Part 2 Example:")
-result2 = solve(example, part2=True)
-print(f"Total fresh IDs in ranges: {result2}")
-print(f"Expected: 14")
-print()
-
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_input = f.read()
-        print("Part 1 Puzzle answer:")
-        answer1 = solve(puzzle_input)
-        print(f"Number of fresh ingredients: {answer1}")
-        print()
-        print("Part 2 Puzzle answer:")
-        answer2 = solve(puzzle_input, part2=True)
-        print(f"Total fresh IDs in ranges: {answer2}")
-        break
-else:
-    print("No input file found.")
+    print("Example:")
+    ranges, ids = parse_input(example)
+    print(f"Ranges: {ranges}")
+    print(f"Ingredient IDs: {ids}")
+    print()
+
+    for id_val in ids:
+        fresh = is_fresh(id_val, ranges)
+        print(f"Ingredient ID {id_val}: {'fresh' if fresh else 'spoiled'}")
+    print()
+
+    result = solve(example)
+    print(f"Total fresh ingredients: {result}")
+    print(f"Expected: 3")
+    print()
+
+    print("Part 2 Example:")
+    result2 = solve(example, part2=True)
+    print(f"Total fresh IDs in ranges: {result2}")
+    print(f"Expected: 14")
+    print()
+
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Part 1 Puzzle answer:")
+            answer1 = solve(puzzle_input)
+            print(f"Number of fresh ingredients: {answer1}")
+            print()
+            print("Part 2 Puzzle answer:")
+            answer2 = solve(puzzle_input, part2=True)
+            print(f"Total fresh IDs in ranges: {answer2}")
+            break
+    else:
+        print("No input file found.")
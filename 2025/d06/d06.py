@@ -1,4 +1,5 @@
 import os
+import random
 
 
 def extract_problem(padded_lines, column_indices, cephalopod_mode=False):
@@ -139,7 +140,19 @@ def solve(input_text, cephalopod_mode=False):
         The grand total (sum of all problem results)
     """
     problems = parse_worksheet(input_text, cephalopod_mode)
+    return solve_problems(problems)
+
+
+def solve_problems(problems):
+    """
+    Solve every parsed problem and return the grand total.
     
+    Args:
+        problems: List of tuples (numbers_list, operation)
+    
+    Returns:
+        The grand total (sum of all problem results)
+    """
     grand_total = 0
     for numbers, operation in problems:
         result = solve_problem(numbers, operation)
@@ -148,6 +161,54 @@ def solve(input_text, cephalopod_mode=False):
     return grand_total
 
 
+def parse1(input_text):
+    return parse_worksheet(input_text)
+
+
+def parse2(input_text):
+    return parse_worksheet(input_text, cephalopod_mode=True)
+
+
+def solve1(problems):
+    """Grand total of the worksheet read row by row."""
+    return solve_problems(problems)
+
+
+def solve2(problems):
+    """Grand total of the worksheet read the cephalopod way."""
+    return solve_problems(problems)
+
+
+def part1(input_text):
+    return solve1(parse1(input_text))
+
+
+def part2(input_text):
+    return solve2(parse2(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate a random worksheet with ``scale`` times the problems of the puzzle input.
+
+    The puzzle input has 1,000 problems of four numbers with up to four
+    digits each, aligned either left or right within their columns.
+    """
+    rng = random.Random(seed)
+    rows = [[] for _ in range(5)]
+    for problem in range(max(1, round(1000 * scale))):
+        width = rng.randint(1, 4)
+        numbers = [str(rng.randint(1, 10 ** rng.randint(1, width) - 1)) for _ in range(4)]
+        # The first line must not start with a space, it would be stripped
+        widest = 0 if problem == 0 else rng.randrange(4)
+        numbers[widest] = str(rng.randint(10 ** (width - 1), 10 ** width - 1))
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        rows[4].append(rng.choice('+*').ljust(width))
+    return '\n'.join(' '.join(row) for row in rows) + '\n'
+
+
 if __name__ == '__main__':
     # Test with the example from the puzzle description
     example = """123 328  51 64 
@@ -1,3 +1,14 @@
+import random
+import sys
+from pathlib import Path
+
+try:
+    from aoc import metrics
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc import metrics
+
+
 def parse_manifold(input_text):
     """
     Parse the tachyon manifold diagram.
@@ -122,8 +133,7 @@ def simulate_quantum_beams(grid, start_pos):
     iteration = 0
     while beams:
         iteration += 1
-        if iteration % 100 == 0:
-            print(f"Iteration {iteration}, active beams: {len(beams)}, completed: {completed_count}")
+        metrics.peak('active_beams', len(beams))
         
         new_beams = {}
         
@@ -161,7 +171,7 @@ def simulate_quantum_beams(grid, start_pos):
         
         beams = new_beams
     
-    print(f"Final: {completed_count} timelines")
+    metrics.gauge('iterations', iteration)
     return completed_count
 
 
@@ -184,8 +194,57 @@ def solve(input_text, quantum_mode=False):
         return simulate_beams(grid, start_pos)
 
 
-# Test with the example
-example = """.......S.......
+def parse(input_text):
+    return parse_manifold(input_text)
+
+
+def solve1(manifold):
+    """Number of times the beam is split."""
+    grid, start_pos = manifold
+    return simulate_beams(grid, start_pos)
+
+
+def solve2(manifold):
+    """Number of timelines of a single quantum tachyon particle."""
+    grid, start_pos = manifold
+    return simulate_quantum_beams(grid, start_pos)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate a random manifold with ``scale`` times the cells of the puzzle input.
+
+    The puzzle input is 141 wide and 142 tall. Splitters sit on every other
+    row, in a triangle widening below the start with a few left out.
+    """
+    rng = random.Random(seed)
+    width = max(3, round(141 * scale ** 0.5))
+    height = max(2, round(142 * scale ** 0.5))
+    mid = width // 2
+
+    grid = [['.'] * width for _ in range(height)]
+    grid[0][mid] = 'S'
+    for row in range(2, height, 2):
+        spread = row // 2 - 1
+        for col in range(mid - spread, mid + spread + 1, 2):
+            if 0 <= col < width and rng.random() < 0.8:
+                grid[row][col] = '^'
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    # Test with the example
+    example = """.......S.......
 ...............
 .......^.......
 ...............
@@ -202,31 +261,31 @@ example = """.......S.......
 .^.^.^.^.^...^.
 ..............."""
 
-print("Part 1 Example:")
-result = solve(example)
-print(f"Beam splits: {result}")
-print(f"Expected: 21")
-print()
-
-print("Part 2 Example:")
-result2 = solve(example, quantum_mode=True)
-print(f"Timelines: {result2}")
-print(f"Expected: 40")
-print()
-
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_input = f.read()
-        print("Part 1 Puzzle answer:")
-        answer1 = solve(puzzle_input)
-        print(f"Beam splits: {answer1}")
-        print()
-        print("Part 2 Puzzle answer:")
-        answer2 = solve(puzzle_input, quantum_mode=True)
-        print(f"Timelines: {answer2}")
-        break
-else:
-    print("No input file found.")
+    print("Part 1 Example:")
+    result = solve(example)
+    print(f"Beam splits: {result}")
+    print(f"Expected: 21")
+    print()
+
+    print("Part 2 Example:")
+    result2 = solve(example, quantum_mode=True)
+    print(f"Timelines: {result2}")
+    print(f"Expected: 40")
+    print()
+
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Part 1 Puzzle answer:")
+            answer1 = solve(puzzle_input)
+            print(f"Beam splits: {answer1}")
+            print()
+            print("Part 2 Puzzle answer:")
+            answer2 = solve(puzzle_input, quantum_mode=True)
+            print(f"Timelines: {answer2}")
+            break
+    else:
+        print("No input file found.")
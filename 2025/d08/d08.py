@@ -1,5 +1,14 @@
 import heapq
+import random
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+try:
+    from aoc.parsing import ints, rows
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc.parsing import ints, rows
 
 
 class UnionFind:
@@ -42,11 +51,7 @@ class UnionFind:
 
 def parse_input(input_text):
     """Parse junction box positions."""
-    positions = []
-    for line in input_text.strip().split('\n'):
-        x, y, z = map(int, line.split(','))
-        positions.append((x, y, z))
-    return positions
+    return rows(ints(input_text), 3)
 
 
 def distance(p1, p2):
@@ -54,19 +59,18 @@ def distance(p1, p2):
     return ((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2 + (p1[2] - p2[2])**2) ** 0.5
 
 
-def solve(input_text, num_connections=1000, debug=False):
+def connect_closest(positions, num_connections=1000, debug=False):
     """
     Connect the closest pairs of junction boxes and find circuit sizes.
     
     Args:
-        input_text: Input containing junction box positions
+        positions: List of (x, y, z) junction box positions
         num_connections: Number of connections to make
         debug: If True, print circuit sizes
     
     Returns:
         Product of the three largest circuit sizes
     """
-    positions = parse_input(input_text)
     n = len(positions)
     
     # Create a min-heap of all pairwise distances
@@ -104,18 +108,17 @@ def solve(input_text, num_connections=1000, debug=False):
     return result
 
 
-def solve_part2(input_text, debug=False):
+def connect_all(positions, debug=False):
     """
     Connect junction boxes until they're all in one circuit.
     
     Args:
-        input_text: Input containing junction box positions
+        positions: List of (x, y, z) junction box positions
         debug: If True, print progress
     
     Returns:
         Product of X coordinates of last two boxes connected
     """
-    positions = parse_input(input_text)
     n = len(positions)
     
     # Create a min-heap of all pairwise distances
@@ -143,8 +146,75 @@ def solve_part2(input_text, debug=False):
     return x1 * x2
 
 
-# Test with the example
-example = """162,817,812
+def solve(input_text, num_connections=1000, debug=False):
+    """
+    Connect the closest pairs of junction boxes and find circuit sizes.
+    
+    Args:
+        input_text: Input containing junction box positions
+        num_connections: Number of connections to make
+        debug: If True, print circuit sizes
+    
+    Returns:
+        Product of the three largest circuit sizes
+    """
+    return connect_closest(parse_input(input_text), num_connections, debug)
+
+
+def solve_part2(input_text, debug=False):
+    """
+    Connect junction boxes until they're all in one circuit.
+    
+    Args:
+        input_text: Input containing junction box positions
+        debug: If True, print progress
+    
+    Returns:
+        Product of X coordinates of last two boxes connected
+    """
+    return connect_all(parse_input(input_text), debug)
+
+
+def parse(input_text):
+    return parse_input(input_text)
+
+
+def solve1(positions):
+    """Product of the three largest circuits after 1000 connections."""
+    return connect_closest(positions, num_connections=1000)
+
+
+def solve2(positions):
+    """Product of the X coordinates of the last two boxes connected."""
+    return connect_all(positions)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate random junction boxes, ``scale`` times as many as the puzzle input.
+
+    The puzzle input has 1,000 boxes with coordinates below 100,000.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(max(2, round(1000 * scale))):
+        lines.append(f"{rng.randrange(100000)},{rng.randrange(100000)},{rng.randrange(100000)}")
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    # Test with the example
+    example = """162,817,812
 57,618,57
 906,360,560
 592,479,940
@@ -165,31 +235,31 @@ example = """162,817,812
 984,92,344
 425,690,689"""
 
-print("Example (10 connections):")
-result = solve(example, num_connections=10, debug=True)
-print(f"Product of three largest circuits: {result}")
-print(f"Expected: 40")
-print()
-
-print("Example Part 2 (connect all):")
-result2 = solve_part2(example, debug=False)
-print(f"Product of X coordinates: {result2}")
-print(f"Expected: 25272")
-print()
-
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_input = f.read()
-        print("Puzzle Part 1 (1000 connections):")
-        answer = solve(puzzle_input, num_connections=1000)
-        print(f"Product of three largest circuits: {answer}")
-        print()
-        print("Puzzle Part 2 (connect all):")
-        answer2 = solve_part2(puzzle_input, debug=False)
-        print(f"Product of X coordinates: {answer2}")
-        break
-else:
-    print("No input file found.")
+    print("Example (10 connections):")
+    result = solve(example, num_connections=10, debug=True)
+    print(f"Product of three largest circuits: {result}")
+    print(f"Expected: 40")
+    print()
+
+    print("Example Part 2 (connect all):")
+    result2 = solve_part2(example, debug=False)
+    print(f"Product of X coordinates: {result2}")
+    print(f"Expected: 25272")
+    print()
+
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Puzzle Part 1 (1000 connections):")
+            answer = solve(puzzle_input, num_connections=1000)
+            print(f"Product of three largest circuits: {answer}")
+            print()
+            print("Puzzle Part 2 (connect all):")
+            answer2 = solve_part2(puzzle_input, debug=False)
+            print(f"Product of X coordinates: {answer2}")
+            break
+    else:
+        print("No input file found.")
@@ -1,3 +1,16 @@
+import random
+import sys
+from pathlib import Path
+
+try:
+    from aoc import metrics
+    from aoc.parsing import ints, rows
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc import metrics
+    from aoc.parsing import ints, rows
+
+
 def parse_input(input_text):
     """
     Parse the input to get red tile positions.
@@ -8,11 +21,7 @@ def parse_input(input_text):
     Returns:
         List of (x, y) tuples representing red tile positions
     """
-    positions = []
-    for line in input_text.strip().split('\n'):
-        x, y = map(int, line.split(','))
-        positions.append((x, y))
-    return positions
+    return rows(ints(input_text), 2)
 
 
 def point_in_polygon(point, polygon):
@@ -66,7 +75,7 @@ def point_in_polygon(point, polygon):
     return inside
 
 
-def solve(input_text):
+def largest_rectangle(positions):
     """
     Part 1: Find the largest rectangle using two red tiles as opposite corners.
     
@@ -81,12 +90,11 @@ def solve(input_text):
     - Track and return the maximum area found
     
     Args:
-        input_text: Input containing red tile positions
+        positions: List of (x, y) red tile positions
     
     Returns:
         Maximum rectangle area
     """
-    positions = parse_input(input_text)
     n = len(positions)
     
     max_area = 0
@@ -137,8 +145,9 @@ def rectangle_valid_in_polygon(min_x, max_x, min_y, max_y, positions):
     ]
     
     # First check: all corners must be inside/on polygon
-    for corner in corners:
+    for i, corner in enumerate(corners, 1):
         if not point_in_polygon(corner, positions):
+            metrics.incr('point_in_polygon_calls', i)
             return False
     
     # Second check: sample points along each edge
@@ -161,14 +170,16 @@ def rectangle_valid_in_polygon(min_x, max_x, min_y, max_y, positions):
         sample_points.append((max_x, y))  # Right edge
     
     # Verify all sampled points are inside the polygon
-    for point in sample_points:
+    for i, point in enumerate(sample_points, 1):
         if not point_in_polygon(point, positions):
+            metrics.incr('point_in_polygon_calls', len(corners) + i)
             return False
     
+    metrics.incr('point_in_polygon_calls', len(corners) + len(sample_points))
     return True
 
 
-def solve_part2(input_text):
+def largest_valid_rectangle(positions):
     """
     Part 2: Find the largest rectangle using two red tiles as opposite corners,
     where ALL tiles in the rectangle must be red or green.
@@ -188,26 +199,20 @@ def solve_part2(input_text):
     - Track the maximum valid rectangle area
     
     Args:
-        input_text: Input containing red tile positions in order
+        positions: List of (x, y) red tile positions in order
     
     Returns:
         Maximum valid rectangle area
     """
-    positions = parse_input(input_text)
     n = len(positions)
     
-    print(f"Part 2: Processing {n} red tiles...")
-    print(f"Total pairs to check: {n * (n - 1) // 2}")
-    
     max_area = 0
     pairs_checked = 0
-    total_pairs = n * (n - 1) // 2
     
     # Try all pairs of red tiles as opposite corners
     for i in range(n):
-        # Progress reporting every 50 tiles
-        if i % 50 == 0:
-            print(f"Progress: tile {i}/{n}, {pairs_checked}/{total_pairs} pairs checked, max area: {max_area}")
+        metrics.gauge('tiles_done', i)
+        metrics.gauge('max_area', max_area)
         
         for j in range(i + 1, n):
             pairs_checked += 1
@@ -229,15 +234,80 @@ def solve_part2(input_text):
             min_y, max_y = min(y1, y2), max(y1, y2)
             
             # Check if rectangle is valid (fully contained in polygon)
+            metrics.incr('rectangles_checked')
             if rectangle_valid_in_polygon(min_x, max_x, min_y, max_y, positions):
                 max_area = area
     
-    print(f"Final: checked {pairs_checked} pairs, max area: {max_area}")
+    metrics.incr('pairs_checked', pairs_checked)
+    metrics.gauge('max_area', max_area)
     return max_area
 
 
-# Test with the example
-example = """7,1
+def solve(input_text):
+    """Part 1: Largest rectangle with two red tiles as opposite corners."""
+    return largest_rectangle(parse_input(input_text))
+
+
+def solve_part2(input_text):
+    """Part 2: Largest such rectangle made only of red and green tiles."""
+    return largest_valid_rectangle(parse_input(input_text))
+
+
+def parse(input_text):
+    return parse_input(input_text)
+
+
+def solve1(positions):
+    """Largest rectangle with two red tiles as opposite corners."""
+    return largest_rectangle(positions)
+
+
+def solve2(positions):
+    """Largest such rectangle made only of red and green tiles."""
+    return largest_valid_rectangle(positions)
+
+
+def part1(input_text):
+    return solve1(parse(input_text))
+
+
+def part2(input_text):
+    return solve2(parse(input_text))
+
+
+def generate(scale=1, seed=0):
+    """
+    Generate a random rectilinear polygon with ``scale`` times the red tiles
+    of the puzzle input.
+
+    The puzzle input has about 500 red tiles with coordinates below 100,000.
+    The generated polygon is a histogram: columns of random height standing
+    on the x axis, listed in boundary order like the puzzle input.
+    """
+    rng = random.Random(seed)
+    columns = max(2, round((496 * scale - 2) / 2))
+    xs = sorted(rng.sample(range(max(100000, 4 * columns)), columns + 1))
+
+    heights = []
+    for _ in range(columns):
+        height = rng.randint(1, 100000)
+        while heights and height == heights[-1]:
+            height = rng.randint(1, 100000)
+        heights.append(height)
+
+    tiles = [(xs[0], 0)]
+    for i, height in enumerate(heights):
+        tiles.append((xs[i], height))
+        tiles.append((xs[i + 1], height))
+    tiles.append((xs[-1], 0))
+    return '\n'.join(f"{x},{y}" for x, y in tiles) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    # Test with the example
+    example = """7,1
 11,1
 11,7
 9,7
@@ -246,31 +316,31 @@ example = """7,1
 2,3
 7,3"""
 
-print("Example:")
-result = solve(example)
-print(f"Largest rectangle area: {result}")
-print(f"Expected: 50")
-print()
-
-print("Example Part 2:")
-result2 = solve_part2(example)
-print(f"Largest rectangle area (red/green only): {result2}")
-print(f"Expected: 24")
-print()
-
-# Solve the actual puzzle
-import os
-for filename in ['input.txt', 'input']:
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            puzzle_input = f.read()
-        print("Puzzle Part 1:")
-        answer = solve(puzzle_input)
-        print(f"Largest rectangle area: {answer}")
-        print()
-        print("Puzzle Part 2:")
-        answer2 = solve_part2(puzzle_input)
-        print(f"Largest rectangle area (red/green only): {answer2}")
-        break
-else:
-    print("No input file found.")
+    print("Example:")
+    result = solve(example)
+    print(f"Largest rectangle area: {result}")
+    print(f"Expected: 50")
+    print()
+
+    print("Example Part 2:")
+    result2 = solve_part2(example)
+    print(f"Largest rectangle area (red/green only): {result2}")
+    print(f"Expected: 24")
+    print()
+
+    # Solve the actual puzzle
+    for filename in ['input.txt', 'input']:
+        filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                puzzle_input = f.read()
+            print("Puzzle Part 1:")
+            answer = solve(puzzle_input)
+            print(f"Largest rectangle area: {answer}")
+            print()
+            print("Puzzle Part 2:")
+            answer2 = solve_part2(puzzle_input)
+            print(f"Largest rectangle area (red/green only): {answer2}")
+            break
+    else:
+        print("No input file found.")
@@ -1,23 +1,34 @@
-import re
+import random
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+try:
+    from aoc import metrics
+    from aoc.parsing import as_bytes, ints
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc import metrics
+    from aoc.parsing import as_bytes, ints
+
 def parse_line(line: str) -> Tuple[List[bool], List[List[int]], List[int]]:
     """Parse a machine line into target state, button configurations, and joltage requirements."""
-    # Extract the target pattern [.##.]
-    target_match = re.search(r'\[([.#]+)\]', line)
-    target = [c == '#' for c in target_match.group(1)]
+    lights, _, rest = as_bytes(line).partition(b']')
     
-    # Extract all button configurations (1,2,3)
-    buttons = []
-    for match in re.finditer(r'\(([0-9,]+)\)', line):
-        button = [int(x) for x in match.group(1).split(',')]
-        buttons.append(button)
+    # Target pattern [.##.]
+    target = [c == ord('#') for c in lights[lights.index(b'[') + 1:]]
     
-    # Extract joltage requirements {3,5,4,7}
-    joltage_match = re.search(r'\{([0-9,]+)\}', line)
-    joltage = [int(x) for x in joltage_match.group(1).split(',')]
+    # Button configurations (1,2,3) followed by joltage requirements {3,5,4,7};
+    # every group's integers are consecutive, one more than its commas
+    values = ints(rest).tolist()
+    groups = []
+    start = 0
+    for group in rest.split(b')'):
+        end = start + group.count(b',') + 1
+        groups.append(values[start:end])
+        start = end
     
-    return target, buttons, joltage
+    return target, groups[:-1], groups[-1]
 
 def solve_machine(target: List[bool], buttons: List[List[int]]) -> int:
     """
@@ -86,6 +97,7 @@ def solve_machine(target: List[bool], buttons: List[List[int]]) -> int:
     
     # Try all combinations of free variables to find minimum
     min_presses = float('inf')
+    metrics.incr('masks', 1 << len(free_vars))
     
     for mask in range(1 << len(free_vars)):
         button_presses = [0] * n_buttons
@@ -222,70 +234,116 @@ def solve_machine_part2(joltage_target: List[int], buttons: List[List[int]]) ->
     result = can_reach_target([0] * n_counters, joltage_target[:], 0, [])
     return result if result != float('inf') else 0
 
-def solve_part1(filename: str) -> int:
-    """Solve part 1 - find minimum button presses for all machines."""
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-    
+def parse(input_text: str) -> List[Tuple[List[bool], List[List[int]], List[int]]]:
+    """Parse every non-empty machine line."""
+    return [parse_line(line) for line in as_bytes(input_text).split(b'\n') if line.strip()]
+
+
+def solve1(machines) -> int:
+    """Fewest presses to configure the indicator lights of every machine."""
     total_presses = 0
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        target, buttons, _ = parse_line(line)
+    for target, buttons, _ in machines:
         presses = solve_machine(target, buttons)
         total_presses += presses
     
     return total_presses
 
 
-def solve_part2(filename: str) -> int:
-    """Solve part 2 - find minimum button presses for joltage targets."""
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-    
+def solve2(machines) -> int:
+    """Fewest presses to configure the joltage counters of every machine."""
     total_presses = 0
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        _, buttons, joltage = parse_line(line)
+    for _, buttons, joltage in machines:
         presses = solve_machine_part2(joltage, buttons)
         total_presses += presses
     
     return total_presses
 
-# Test with example
-example = """[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
+
+def solve_part1(input_text: str) -> int:
+    """Solve part 1 - find minimum button presses for all machines."""
+    return solve1(parse(input_text))
+
+
+def solve_part2(input_text: str) -> int:
+    """Solve part 2 - find minimum button presses for joltage targets."""
+    return solve2(parse(input_text))
+
+
+def part1(input_text: str) -> int:
+    return solve_part1(input_text)
+
+
+def part2(input_text: str) -> int:
+    return solve_part2(input_text)
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    """
+    Generate random machines, ``scale`` times as many as the puzzle input.
+
+    The puzzle input has about 170 machines with 4-10 lights and a handful
+    of buttons each. Light patterns and joltage targets are built from
+    random button presses so that every machine is solvable.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(max(1, round(171 * scale))):
+        n_lights = rng.randint(4, 10)
+        buttons = []
+        for _ in range(rng.randint(3, n_lights + 3)):
+            buttons.append(sorted(rng.sample(range(n_lights), rng.randint(1, n_lights - 1))))
+
+        lights = [False] * n_lights
+        joltage = [0] * n_lights
+        for button in buttons:
+            toggled = rng.random() < 0.5
+            presses = rng.randint(0, 30)
+            for light in button:
+                lights[light] ^= toggled
+                joltage[light] += presses
+        target = ''.join('#' if on else '.' for on in lights)
+
+        button_text = ' '.join('(' + ','.join(map(str, b)) + ')' for b in buttons)
+        lines.append(f"[{target}] {button_text} {{{','.join(map(str, joltage))}}}")
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    input_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input')
+    with open(input_file, 'r') as f:
+        puzzle_input = f.read()
+
+    # Test with example
+    example = """[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
 [...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
 [.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"""
 
-# Test Part 1
-print("=== Part 1 ===")
-total = 0
-for i, line in enumerate(example.split('\n'), 1):
-    target, buttons, _ = parse_line(line)
-    presses = solve_machine(target, buttons)
-    print(f"Machine {i}: needs {presses} button presses")
-    total += presses
-
-print(f"Example total: {total} (expected 7)")
-
-result = solve_part1('input')
-print(f"Part 1 answer: {result}")
-
-# Test Part 2
-print("\n=== Part 2 ===")
-total = 0
-for i, line in enumerate(example.split('\n'), 1):
-    _, buttons, joltage = parse_line(line)
-    presses = solve_machine_part2(joltage, buttons)
-    print(f"Machine {i}: joltage target={joltage}, needs {presses} button presses")
-    total += presses
-
-print(f"Example total: {total} (expected 33)")
-
-result = solve_part2('input')
-print(f"Part 2 answer: {result}")
\ No newline at end of file
+    # Test Part 1
+    print("=== Part 1 ===")
+    total = 0
+    for i, line in enumerate(example.split('\n'), 1):
+        target, buttons, _ = parse_line(line)
+        presses = solve_machine(target, buttons)
+        print(f"Machine {i}: needs {presses} button presses")
+        total += presses
+
+    print(f"Example total: {total} (expected 7)")
+
+    result = solve_part1(puzzle_input)
+    print(f"Part 1 answer: {result}")
+
+    # Test Part 2
+    print("\n=== Part 2 ===")
+    total = 0
+    for i, line in enumerate(example.split('\n'), 1):
+        _, buttons, joltage = parse_line(line)
+        presses = solve_machine_part2(joltage, buttons)
+        print(f"Machine {i}: joltage target={joltage}, needs {presses} button presses")
+        total += presses
+
+    print(f"Example total: {total} (expected 33)")
+
+    result = solve_part2(puzzle_input)
+    print(f"Part 2 answer: {result}")
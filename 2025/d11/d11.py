@@ -8,25 +8,33 @@ This is a graph path enumeration problem. We need to:
 3. Count the total number of paths
 """
 
+import random
+import sys
+from pathlib import Path
 from typing import Dict, List, Set
 
+try:
+    from aoc import metrics
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc import metrics
 
-def parse_input(filename: str) -> Dict[str, List[str]]:
-    """Parse the input file and build the adjacency list graph."""
+
+def parse_input(input_text: str) -> Dict[str, List[str]]:
+    """Parse the device list and build the adjacency list graph."""
     graph = {}
     
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse "device: output1 output2 ..."
-            parts = line.split(': ')
-            device = parts[0]
-            outputs = parts[1].split() if len(parts) > 1 else []
-            
-            graph[device] = outputs
+    for line in input_text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Parse "device: output1 output2 ..."
+        parts = line.split(': ')
+        device = parts[0]
+        outputs = parts[1].split() if len(parts) > 1 else []
+        
+        graph[device] = outputs
     
     return graph
 
@@ -60,6 +68,9 @@ def count_paths(graph: Dict[str, List[str]], start: str, end: str) -> int:
         
         return total_paths
     
+    if metrics.enabled:
+        dfs = metrics.counted('dfs_calls', dfs)
+    
     # Start DFS with initial node in visited set
     return dfs(start, {start})
 
@@ -98,72 +109,116 @@ def count_paths_with_required_nodes(graph: Dict[str, List[str]], start: str, end
         
         return total_paths
     
+    if metrics.enabled:
+        dfs = metrics.counted('dfs_calls', dfs)
+    
     # Start DFS
     initial_required = frozenset({start}) if start in required else frozenset()
     return dfs(start, initial_required)
 
 
-def solve_part1(filename: str) -> int:
-    """Solve part 1 - count paths from 'you' to 'out'."""
-    graph = parse_input(filename)
+def parse(input_text: str) -> Dict[str, List[str]]:
+    return parse_input(input_text)
+
+
+def solve1(graph: Dict[str, List[str]]) -> int:
+    """Number of paths from 'you' to 'out'."""
     return count_paths(graph, 'you', 'out')
 
 
-def solve_part2(filename: str) -> int:
-    """Solve part 2 - count paths from 'svr' to 'out' that visit both 'dac' and 'fft'."""
-    graph = parse_input(filename)
+def solve2(graph: Dict[str, List[str]]) -> int:
+    """Number of paths from 'svr' to 'out' through both 'dac' and 'fft'."""
     required_nodes = {'dac', 'fft'}
     return count_paths_with_required_nodes(graph, 'svr', 'out', required_nodes)
 
 
-# Test with example
-example_input = """aaa: you hhh
-you: bbb ccc
-bbb: ddd eee
-ccc: ddd eee fff
-ddd: ggg
-eee: out
-fff: out
-ggg: out
-hhh: ccc fff iii
-iii: out"""
-
-# Part 2 example
-example_input_part2 = """svr: aaa bbb
-aaa: fft
-fft: ccc
-bbb: tty
-tty: ccc
-ccc: ddd eee
-ddd: hub
-hub: fff
-eee: dac
-dac: fff
-fff: ggg hhh
-ggg: out
-hhh: out"""
-
-# Create example files
-with open('example', 'w') as f:
-    f.write(example_input)
-
-with open('example2', 'w') as f:
-    f.write(example_input_part2)
-
-# Test example
-print("=== Part 1 ===")
-example_result = solve_part1('example')
-print(f"Example: {example_result} paths (expected 5)")
-
-# Solve actual puzzle
-result = solve_part1('input')
-print(f"Part 1 answer: {result}")
-
-# Test Part 2
-print("\n=== Part 2 ===")
-example_result2 = solve_part2('example2')
-print(f"Example: {example_result2} paths (expected 2)")
-
-# Solve actual puzzle
-result2 = solve_part2('input')
-print(f"Part 2 answer: {result2}")
+def solve_part1(input_text: str) -> int:
+    """Solve part 1 - count paths from 'you' to 'out'."""
+    return solve1(parse(input_text))
+
+
+def solve_part2(input_text: str) -> int:
+    """Solve part 2 - count paths from 'svr' to 'out' that visit both 'dac' and 'fft'."""
+    return solve2(parse(input_text))
+
+
+def part1(input_text: str) -> int:
+    return solve_part1(input_text)
+
+
+def part2(input_text: str) -> int:
+    return solve_part2(input_text)
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    """
+    Generate a random device graph with ``scale`` times the devices of the
+    puzzle input.
+
+    The puzzle input has about 600 devices wired as a DAG from 'svr' to
+    'out'. The generated graph is layered: every device feeds one to three
+    devices of the next layer, 'fft', 'dac' and 'you' sit on the way down
+    and the last layer feeds 'out'.
+    """
+    rng = random.Random(seed)
+    depth = 16
+    width = max(1, round(612 * scale / depth))
+    reserved = {'svr', 'fft', 'dac', 'you', 'out'}
+
+    def names():
+        length, index = 3, 0
+        while True:
+            if index == 26 ** length:
+                length, index = length + 1, 0
+            name, value = '', index
+            for _ in range(length):
+                value, digit = divmod(value, 26)
+                name = chr(ord('a') + digit) + name
+            index += 1
+            if name not in reserved:
+                yield name
+
+    name_iter = names()
+    layers = [[next(name_iter) for _ in range(width)] for _ in range(depth)]
+    layers[0][0] = 'svr'
+    layers[depth // 3][0] = 'fft'
+    layers[2 * depth // 3][0] = 'dac'
+    layers[3 * depth // 4][-1] = 'you'
+
+    lines = []
+    for layer, next_layer in zip(layers, layers[1:]):
+        for device in layer:
+            outputs = rng.sample(next_layer, min(len(next_layer), rng.randint(1, 3)))
+            lines.append(f"{device}: {' '.join(outputs)}")
+    for device in layers[-1]:
+        lines.append(f"{device}: out")
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def read(name: str) -> str:
+        with open(os.path.join(here, name), 'r') as f:
+            return f.read()
+
+    # Test example
+    print("=== Part 1 ===")
+    example_result = solve_part1(read('example'))
+    print(f"Example: {example_result} paths (expected 5)")
+
+    # Solve actual puzzle
+    result = solve_part1(read('input'))
+    print(f"Part 1 answer: {result}")
+
+    # Test Part 2
+    print("\n=== Part 2 ===")
+    example_result2 = solve_part2(read('example2'))
+    print(f"Example: {example_result2} paths (expected 2)")
+
+    # Solve actual puzzle
+    result2 = solve_part2(read('input'))
+    print(f"Part 2 answer: {result2}")
@@ -13,14 +13,22 @@ Strategy:
 3. Count how many regions can fit all their presents
 """
 
-from typing import List, Set, Tuple
+import random
+import sys
 from copy import deepcopy
+from pathlib import Path
+from typing import List, Set, Tuple
+
+try:
+    from aoc import metrics
+except ImportError:  # run as a script from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from aoc import metrics
 
 
-def parse_input(filename: str):
-    """Parse the input file to extract shapes and regions."""
-    with open(filename, 'r') as f:
-        content = f.read().strip()
+def parse_input(input_text: str):
+    """Parse the puzzle input to extract shapes and regions."""
+    content = input_text.strip()
     
     sections = content.split('\n\n')
     
@@ -201,85 +209,107 @@ def solve_region(shapes: dict, width: int, height: int, counts: List[int]) -> bo
         
         return False
     
+    if metrics.enabled:
+        backtrack = metrics.counted('backtrack_nodes', backtrack)
+    
     return backtrack(0)
 
 
-def solve_part1(filename: str) -> int:
+def count_fitting_regions(shapes: dict, regions: List[Tuple[int, int, List[int]]]) -> int:
     """Count how many regions can fit all their presents."""
-    shapes, regions = parse_input(filename)
-    
-    # Check area of each shape
-    print("Shape areas:")
-    for shape_id in sorted(shapes.keys()):
-        coords = get_shape_coords(shapes[shape_id])
-        print(f"  Shape {shape_id}: {len(coords)} cells")
-    
     count = 0
-    for i, (width, height, counts) in enumerate(regions):
+    for width, height, counts in regions:
         total_shape_area = sum(
             len(get_shape_coords(shapes[shape_id])) * count
             for shape_id, count in enumerate(counts)
         )
         grid_area = width * height
-        
-        print(f"Region {i+1}: {width}x{height} = {grid_area} cells, needs {total_shape_area} cells for {sum(counts)} presents")
+        metrics.incr('regions')
         
         if total_shape_area <= grid_area:
             # Do actual packing test only if area check passes
-            if solve_region(shapes, width, height, counts):
+            with metrics.timer('solve_region'):
+                fits = solve_region(shapes, width, height, counts)
+            if fits:
                 count += 1
-                print(f"  ✓ Can fit")
+                metrics.incr('regions_fit')
             else:
-                print(f"  ✗ Cannot fit (area OK but packing failed)")
+                metrics.incr('regions_packing_failed')
         else:
-            print(f"  ✗ Cannot fit (not enough area)")
+            metrics.incr('regions_too_small')
     
     return count
 
 
-# Test with example
-example_input = """0:
-###
-##.
-##.
-
-1:
-###
-##.
-.##
-
-2:
-.##
-###
-##.
-
-3:
-##.
-###
-##.
-
-4:
-###
-#..
-###
-
-5:
-###
-.#.
-###
-
-4x4: 0 0 0 0 2 0
-12x5: 1 0 1 0 2 2
-12x5: 1 0 1 0 3 2"""
-
-with open('example', 'w') as f:
-    f.write(example_input)
-
-print("=== Part 1 ===")
-print("Testing example...")
-example_result = solve_part1('example')
-print(f"\nExample: {example_result} regions can fit (expected 2)\n")
-
-print("Solving actual puzzle...")
-result = solve_part1('input')
-print(f"\nPart 1 answer: {result}")
+def solve_part1(input_text: str) -> int:
+    """Count how many regions can fit all their presents."""
+    shapes, regions = parse_input(input_text)
+    return count_fitting_regions(shapes, regions)
+
+
+def parse(input_text: str):
+    return parse_input(input_text)
+
+
+def solve1(puzzle) -> int:
+    """Number of regions that can fit all of their presents."""
+    shapes, regions = puzzle
+    return count_fitting_regions(shapes, regions)
+
+
+def part1(input_text: str) -> int:
+    return solve1(parse(input_text))
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    """
+    Generate random shapes and regions, ``scale`` times as many regions as
+    the puzzle input.
+
+    The puzzle input has six 3x3 shapes and 1,000 regions of roughly 35-50
+    by 35-50. A bit over half the regions need 63-74% of their area, the
+    rest need just more than all of it.
+    """
+    rng = random.Random(seed)
+    sections = []
+    areas = []
+    for shape_id in range(6):
+        cells = set(rng.sample(range(9), rng.randint(5, 7)))
+        rows = [''.join('#' if r * 3 + c in cells else '.' for c in range(3)) for r in range(3)]
+        sections.append(f"{shape_id}:\n" + '\n'.join(rows))
+        areas.append(len(cells))
+
+    regions = []
+    for _ in range(max(1, round(1000 * scale))):
+        width, height = rng.randint(35, 50), rng.randint(35, 50)
+        fits = rng.random() < 0.57
+        fill = rng.uniform(0.63, 0.74) if fits else 1.0
+        counts = [0] * 6
+        needed = 0
+        while needed < fill * width * height or (not fits and needed <= width * height):
+            shape_id = rng.randrange(6)
+            counts[shape_id] += 1
+            needed += areas[shape_id]
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+
+    sections.append('\n'.join(regions))
+    return '\n\n'.join(sections) + '\n'
+
+
+if __name__ == '__main__':
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def read(name: str) -> str:
+        with open(os.path.join(here, name), 'r') as f:
+            return f.read()
+
+    print("=== Part 1 ===")
+    print("Testing example...")
+    example_result = solve_part1(read('example'))
+    print(f"\nExample: {example_result} regions can fit (expected 2)\n")
+
+    print("Solving actual puzzle...")
+    result = solve_part1(read('input'))
+    print(f"\nPart 1 answer: {result}")
@@ -9,10 +9,7 @@ example_input = '''4:
 
 4x4: 0 0 0 0 2 0'''
 
-with open('test_small', 'w') as f:
-    f.write(example_input)
-
-shapes, regions = parse_input('test_small')
+shapes, regions = parse_input(example_input)
 
 print("Shapes:")
 for sid in shapes:
@@ -0,0 +1,57 @@
+"""
+Shared tooling for the Advent of Code solutions in this repository.
+
+The day solutions live in ``<year>/dXX/dXX.py`` and expose pure
+``part1(input_text)`` / ``part2(input_text)`` functions. This package
+locates, loads and runs them:
+
+    python -m aoc run 2025 --day 1-12 --part 1,2 --jobs 4
+"""
+
+from aoc.cache import AnswerCache
+from aoc.runner import (
+    call_day,
+    call_in_child,
+    day_dir,
+    input_path,
+    jobs,
+    load_day,
+    load_timings,
+    map_day,
+    parse_days,
+    parse_parts,
+    parse_size,
+    phases_for,
+    read_input,
+    run,
+    run_limited,
+    run_parallel,
+    save_timings,
+    solve_job,
+    solver_for,
+    start_child,
+)
+
+__all__ = [
+    'AnswerCache',
+    'call_day',
+    'call_in_child',
+    'day_dir',
+    'input_path',
+    'jobs',
+    'load_day',
+    'load_timings',
+    'map_day',
+    'parse_days',
+    'parse_parts',
+    'parse_size',
+    'phases_for',
+    'read_input',
+    'run',
+    'run_limited',
+    'run_parallel',
+    'save_timings',
+    'solve_job',
+    'solver_for',
+    'start_child',
+]
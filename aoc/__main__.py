@@ -0,0 +1,312 @@
+"""
+Command line entry point.
+
+    python -m aoc run 2025 --day 1-12 --part 1,2 --jobs 4
+    python -m aoc run 2025 --day 12 --profile
+    python -m aoc bench 2025 --day 1-12 --repeat 5
+    python -m aoc scale 2025 --day 1-12 --max-scale 64
+    python -m aoc memory 2025 --day 8 --top 5
+    python -m aoc generate 2025 4 --scale 5000 > grid.txt
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from aoc import bench, complexity, memory, profiling
+from aoc.cache import DEFAULT_PATH as DEFAULT_CACHE, AnswerCache
+from aoc.runner import (OK, jobs, load_day, load_timings, parse_days, parse_parts,
+                        parse_size, run, run_parallel, save_timings)
+
+
+def schedule_estimates(year: int) -> dict:
+    """Expected seconds per (day, part): last run, else benchmark history."""
+    estimates = {}
+    history = bench.load_history()
+    for day in range(1, 26):
+        for part in (1, 2):
+            previous = bench.previous_result(history, year, day, part)
+            if previous:
+                estimates[(day, part)] = previous['parse']['median'] + previous['solve']['median']
+    estimates.update(load_timings(year))
+    return estimates
+
+
+def cmd_run(args) -> int:
+    """Solve the selected days and print one line per answer."""
+    days = parse_days(args.day)
+    parts = parse_parts(args.part)
+    if args.profile:
+        return profile_run(args, days, parts)
+
+    # Metrics only exist for answers that are actually computed
+    collect_metrics = args.metrics is not None
+    cache = None if args.no_cache or collect_metrics else AnswerCache(args.cache)
+    if cache is not None and args.clear_cache:
+        cache.clear()
+
+    memory_limit = parse_size(args.max_memory) if args.max_memory else None
+    limited = args.timeout is not None or memory_limit is not None
+
+    if args.jobs == 1 and not limited:
+        results_iter = run(args.year, days, parts, cache, collect_metrics)
+    else:
+        results_iter = run_parallel(args.year, days, parts, args.jobs or None,
+                                    schedule_estimates(args.year), cache, collect_metrics,
+                                    args.timeout, memory_limit)
+
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in results_iter:
+            results.append(result)
+            note = 'cached' if result.cached else f"{result.elapsed:.3f}s"
+            answer = result.answer if result.status == OK else result.status
+            print(f"{result.year} day {result.day:2d} part {result.part}: "
+                  f"{answer}  ({note})", flush=True)
+    finally:
+        if cache is not None:
+            cache.close()
+    wall = time.perf_counter() - start
+
+    cpu = sum(r.cpu for r in results)
+    speedup = cpu / wall if wall > 0 else 0.0
+    print(f"Total: {wall:.3f}s wall clock, {cpu:.3f}s CPU summed over jobs ({speedup:.1f}x)")
+
+    solved = [r for r in results if not r.cached]
+    if solved:
+        save_timings(solved)
+    if collect_metrics:
+        write_metrics(results, args.metrics)
+    return 0 if all(r.status == OK for r in results) else 1
+
+
+def write_metrics(results, destination: str):
+    """Dump the metrics of every job as JSON to a file, or stdout for '-'."""
+    report = {}
+    for result in sorted(results, key=lambda r: (r.year, r.day, r.part)):
+        report.setdefault(str(result.year), {})[f"{result.day}.{result.part}"] = result.metrics
+    text = json.dumps(report, indent=2)
+    if destination == '-':
+        print(text)
+    else:
+        Path(destination).write_text(text + '\n')
+        print(f"Metrics written to {destination}")
+
+
+def profile_run(args, days, parts) -> int:
+    """Solve the selected days under cProfile, bypassing the answer cache."""
+    for profile in profiling.profile(args.year, jobs(args.year, days, parts), args.profile_dir):
+        result = profile.result
+        print(f"{result.year} day {result.day:2d} part {result.part}: "
+              f"{result.answer}  ({result.elapsed:.3f}s under cProfile)", flush=True)
+        print(profiling.summary(profile.stats, args.profile_sort, args.profile_top))
+        print(f"Wrote {profile.stats_path} and {profile.collapsed_path}\n", flush=True)
+    return 0
+
+
+def cmd_bench(args) -> int:
+    """Benchmark the selected days and append the results to the history."""
+    days = parse_days(args.day)
+    parts = parse_parts(args.part)
+    history = bench.load_history(args.history)
+    fmt = bench.format_seconds
+
+    print(f"{'day':>3} {'part':>4}  {'parse med':>10} {'p95':>10}  "
+          f"{'solve med':>10} {'p95':>10} {'runs':>5}  {'vs last':>8}")
+
+    results = []
+    for result in bench.benchmark(args.year, days, parts, args.warmup, args.repeat, args.budget):
+        results.append(result)
+
+        change = ''
+        previous = bench.previous_result(history, args.year, result.day, result.part)
+        if previous and previous['solve']['median'] > 0:
+            ratio = result.solve['median'] / previous['solve']['median'] - 1
+            change = f"{ratio:+.1%}"
+
+        print(f"{result.day:>3} {result.part:>4}  "
+              f"{fmt(result.parse['median']):>10} {fmt(result.parse['p95']):>10}  "
+              f"{fmt(result.solve['median']):>10} {fmt(result.solve['p95']):>10} "
+              f"{result.solve['runs']:>5}  {change:>8}")
+
+    if results and not args.no_save:
+        bench.record(results, args.history, warmup=args.warmup,
+                     repeat=args.repeat, budget=args.budget)
+        print(f"Saved to {args.history}")
+    return 0
+
+
+def cmd_memory(args) -> int:
+    """Measure peak memory per phase and append the results to the history."""
+    days = parse_days(args.day)
+    parts = parse_parts(args.part)
+    history = bench.load_history(args.history)
+    fmt = memory.format_bytes
+
+    print(f"{'day':>3} {'part':>4}  {'parse peak':>10}  {'solve peak':>10}  {'max RSS':>10}  {'vs last':>8}")
+
+    results = []
+    for day, part, result in memory.report(args.year, days, parts, args.scale, args.seed,
+                                           args.top, args.timeout):
+        if result is None:
+            print(f"{day:>3} {part:>4}  timed out after {args.timeout:g}s")
+            continue
+        results.append(result)
+
+        change = ''
+        previous = bench.previous_result(history, args.year, day, part,
+                                         scale=args.scale, seed=args.seed)
+        if previous and previous['solve']['peak'] > 0:
+            ratio = result.solve.peak / previous['solve']['peak'] - 1
+            change = f"{ratio:+.1%}"
+
+        print(f"{day:>3} {part:>4}  {fmt(result.parse.peak):>10}  {fmt(result.solve.peak):>10}  "
+              f"{fmt(result.solve.max_rss):>10}  {change:>8}")
+        for phase, phase_memory in (('parse', result.parse), ('solve', result.solve)):
+            for site in phase_memory.top:
+                print(f"{'':>11}{phase}  {fmt(site.size):>10} in {site.count:>8,} blocks  {site.location}")
+
+    if results and not args.no_save:
+        memory.record(results, args.history, scale=args.scale, seed=args.seed)
+        print(f"Saved to {args.history}")
+    return 0
+
+
+def cmd_scale(args) -> int:
+    """Fit runtime against input size on generated inputs."""
+    days = parse_days(args.day)
+    parts = parse_parts(args.part)
+    fmt = bench.format_seconds
+
+    print(f"{'day':>3} {'part':>4}  {'scales':>14}  {'parse k':>8}  {'solve k':>8} {'r2':>5}  verdict")
+    for result in complexity.report(args.year, days, parts, args.start, args.max_scale,
+                                    args.budget, args.timeout, args.seed):
+        if result.points:
+            scales = f"{result.points[0].scale:g}..{result.points[-1].scale:g}"
+        else:
+            scales = '-'
+        parse_k = f"{result.parse_fit.exponent:.2f}" if result.parse_fit else '-'
+        solve_k = f"{result.solve_fit.exponent:.2f}" if result.solve_fit else '-'
+        r2 = f"{result.solve_fit.r_squared:.2f}" if result.solve_fit else '-'
+
+        verdict = complexity.classify(result.solve_fit)
+        if result.timed_out is not None and result.solve_fit is None:
+            verdict = f"timed out at scale {result.timed_out:g}"
+        elif result.timed_out is not None:
+            verdict += f", timed out at scale {result.timed_out:g}"
+
+        print(f"{result.day:>3} {result.part:>4}  {scales:>14}  {parse_k:>8}  {solve_k:>8} {r2:>5}  {verdict}")
+        if args.verbose:
+            for point in result.points:
+                print(f"{'':>11}scale {point.scale:<8g} {point.size:>12,} bytes  "
+                      f"parse {fmt(point.parse):>10}  solve {fmt(point.solve):>10}")
+    return 0
+
+
+def cmd_generate(args) -> int:
+    """Write a generated input to stdout or a file."""
+    input_text = load_day(args.year, args.day).generate(args.scale, args.seed)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(input_text)
+    else:
+        sys.stdout.write(input_text)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='aoc', description="Advent of Code solution runner")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="solve puzzles")
+    run_parser.add_argument('year', type=int)
+    run_parser.add_argument('--day', default='1-25', help="days to run, e.g. 1-12 or 1,3,5 (default: all)")
+    run_parser.add_argument('--part', default='1,2', help="parts to run, e.g. 1,2 (default: both)")
+    run_parser.add_argument('-j', '--jobs', type=int, default=0,
+                            help="worker processes; 1 runs in-process, 0 uses every core (default: 0)")
+    run_parser.add_argument('--timeout', type=float, default=None,
+                            help="kill a job after this many seconds and report TIMEOUT")
+    run_parser.add_argument('--max-memory', default=None, metavar='SIZE',
+                            help="address-space limit per job, e.g. 2G; jobs over it report OOM")
+    run_parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE,
+                            help="answer cache database (default: .cache/answers.sqlite3)")
+    run_parser.add_argument('--no-cache', action='store_true', help="always run the solvers")
+    run_parser.add_argument('--clear-cache', action='store_true', help="empty the answer cache first")
+    run_parser.add_argument('--metrics', nargs='?', const='-', metavar='FILE',
+                            help="record solver counters, gauges and timers and dump them as JSON "
+                                 "to FILE (default: stdout); bypasses the answer cache")
+    run_parser.add_argument('--profile', action='store_true',
+                            help="solve in-process under cProfile and write .prof and collapsed-stack files")
+    run_parser.add_argument('--profile-dir', type=Path, default=profiling.DEFAULT_DIR,
+                            help="where to write profiles (default: profiles/)")
+    run_parser.add_argument('--profile-sort', default='cumulative',
+                            help="pstats sort key for the summary (default: cumulative)")
+    run_parser.add_argument('--profile-top', type=int, default=25,
+                            help="functions shown in the summary (default: 25)")
+    run_parser.set_defaults(func=cmd_run)
+
+    bench_parser = subparsers.add_parser('bench', help="benchmark parse and solve times")
+    bench_parser.add_argument('year', type=int)
+    bench_parser.add_argument('--day', default='1-25', help="days to run, e.g. 1-12 or 1,3,5 (default: all)")
+    bench_parser.add_argument('--part', default='1,2', help="parts to run, e.g. 1,2 (default: both)")
+    bench_parser.add_argument('--warmup', type=int, default=1, help="untimed runs before measuring (default: 1)")
+    bench_parser.add_argument('--repeat', type=int, default=5, help="measured runs (default: 5)")
+    bench_parser.add_argument('--budget', type=float, default=30.0,
+                              help="stop repeating a job after this many seconds (default: 30)")
+    bench_parser.add_argument('--history', type=Path, default=bench.DEFAULT_HISTORY,
+                              help="JSON history file (default: benchmarks/history.json)")
+    bench_parser.add_argument('--no-save', action='store_true', help="do not append to the history")
+    bench_parser.set_defaults(func=cmd_bench)
+
+    scale_parser = subparsers.add_parser('scale', help="fit runtime against input size on generated inputs")
+    scale_parser.add_argument('year', type=int)
+    scale_parser.add_argument('--day', default='1-25', help="days to run, e.g. 1-12 or 1,3,5 (default: all)")
+    scale_parser.add_argument('--part', default='1,2', help="parts to run, e.g. 1,2 (default: both)")
+    scale_parser.add_argument('--start', type=float, default=1 / 16,
+                              help="smallest scale relative to the real input (default: 0.0625)")
+    scale_parser.add_argument('--max-scale', type=float, default=64, help="largest scale (default: 64)")
+    scale_parser.add_argument('--budget', type=float, default=2.0,
+                              help="stop doubling after a run slower than this many seconds (default: 2)")
+    scale_parser.add_argument('--timeout', type=float, default=None,
+                              help="abandon a single run after this many seconds (default: 10x budget)")
+    scale_parser.add_argument('--seed', type=int, default=0)
+    scale_parser.add_argument('-v', '--verbose', action='store_true', help="print every measured point")
+    scale_parser.set_defaults(func=cmd_scale)
+
+    memory_parser = subparsers.add_parser('memory', help="measure peak memory of the parse and solve phases")
+    memory_parser.add_argument('year', type=int)
+    memory_parser.add_argument('--day', default='1-25', help="days to run, e.g. 1-12 or 1,3,5 (default: all)")
+    memory_parser.add_argument('--part', default='1,2', help="parts to run, e.g. 1,2 (default: both)")
+    memory_parser.add_argument('--top', type=int, default=5, help="allocation sites shown per phase (default: 5)")
+    memory_parser.add_argument('--scale', type=float, default=None,
+                               help="measure a generated input this many times the real size instead")
+    memory_parser.add_argument('--seed', type=int, default=0)
+    memory_parser.add_argument('--timeout', type=float, default=None,
+                               help="abandon a job after this many seconds (default: never)")
+    memory_parser.add_argument('--history', type=Path, default=memory.DEFAULT_HISTORY,
+                               help="JSON history file (default: benchmarks/memory.json)")
+    memory_parser.add_argument('--no-save', action='store_true', help="do not append to the history")
+    memory_parser.set_defaults(func=cmd_memory)
+
+    generate_parser = subparsers.add_parser('generate', help="write a synthetic puzzle input")
+    generate_parser.add_argument('year', type=int)
+    generate_parser.add_argument('day', type=int)
+    generate_parser.add_argument('--scale', type=float, default=1.0,
+                                 help="size relative to the real input (default: 1)")
+    generate_parser.add_argument('--seed', type=int, default=0)
+    generate_parser.add_argument('-o', '--output', help="file to write (default: stdout)")
+    generate_parser.set_defaults(func=cmd_generate)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+End-to-end benchmarks of the day solutions.
+
+Parse and solve are timed separately on the checked-in inputs: a few
+warmup runs, then repeated measurements summarized as median and p95.
+Results are appended to a JSON history file keyed by git commit so that
+numbers can be compared across changes:
+
+    python -m aoc bench 2025 --day 1-12 --repeat 5
+"""
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from aoc.runner import ROOT, jobs, phases_for, read_input
+
+DEFAULT_HISTORY = ROOT / 'benchmarks' / 'history.json'
+
+
+class BenchResult(NamedTuple):
+    """Timing statistics for one (day, part), in seconds."""
+    year: int
+    day: int
+    part: int
+    answer: object
+    parse: Dict[str, float]
+    solve: Dict[str, float]
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * q / 100))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Reduce raw timings to the statistics stored in the history."""
+    return {
+        'runs': len(samples),
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 95),
+        'min': min(samples),
+        'mean': statistics.fmean(samples),
+    }
+
+
+def time_phases(parse: Callable, solve: Callable, input_text: str,
+                warmup: int = 1, repeat: int = 5,
+                budget: float = 30.0) -> Tuple[object, List[float], List[float]]:
+    """
+    Time the parse and solve phases of one part.
+
+    The input is re-parsed for every run so that solvers which mutate
+    their parsed data start from the same state each time. Slow solvers
+    stop early once ``budget`` seconds have been spent on measured runs,
+    but always get at least one measured run.
+
+    Returns:
+        Tuple of (answer, parse_samples, solve_samples)
+    """
+    spent = 0.0
+    for _ in range(warmup):
+        start = time.perf_counter()
+        solve(parse(input_text))
+        spent += time.perf_counter() - start
+        if spent >= budget:
+            break
+
+    answer = None
+    parse_samples = []
+    solve_samples = []
+    spent = 0.0
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        data = parse(input_text)
+        t1 = time.perf_counter()
+        answer = solve(data)
+        t2 = time.perf_counter()
+
+        parse_samples.append(t1 - t0)
+        solve_samples.append(t2 - t1)
+        spent += t2 - t0
+        if spent >= budget:
+            break
+
+    return answer, parse_samples, solve_samples
+
+
+def benchmark(year: int, days: List[int], parts: List[int], warmup: int = 1,
+              repeat: int = 5, budget: float = 30.0) -> Iterator[BenchResult]:
+    """
+    Benchmark the selected days and parts one after another.
+
+    Yields:
+        One BenchResult per (day, part)
+    """
+    for day, part in jobs(year, days, parts):
+        phases = phases_for(year, day, part)
+        if phases is None:
+            continue
+        parse, solve = phases
+
+        input_text = read_input(year, day)
+        answer, parse_samples, solve_samples = time_phases(
+            parse, solve, input_text, warmup, repeat, budget)
+        yield BenchResult(year, day, part, answer,
+                          summarize(parse_samples), summarize(solve_samples))
+
+
+def git_revision() -> Tuple[str, bool]:
+    """
+    Return the current commit hash and whether the work tree is dirty.
+
+    Falls back to ``"unknown"`` outside of a git checkout.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return commit, bool(status.strip())
+
+
+def load_history(path: Path = DEFAULT_HISTORY) -> Dict[str, List[dict]]:
+    """Load the benchmark history, or an empty one if none was saved yet."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def previous_result(history: Dict[str, List[dict]], year: int, day: int,
+                    part: int, **settings) -> Optional[dict]:
+    """
+    Return the most recently recorded result for a (year, day, part).
+
+    Only runs whose stored settings match the given ``settings`` are
+    considered, so that e.g. a run on a generated input is not compared
+    with one on the real input.
+    """
+    latest = None
+    for entries in history.values():
+        for entry in entries:
+            if entry['year'] != year:
+                continue
+            stored = entry.get('settings', {})
+            if any(stored.get(name) != value for name, value in settings.items()):
+                continue
+            for result in entry['results']:
+                if result['day'] == day and result['part'] == part:
+                    if latest is None or entry['timestamp'] > latest[0]:
+                        latest = (entry['timestamp'], result)
+    return latest[1] if latest else None
+
+
+def record(results: List[BenchResult], path: Path = DEFAULT_HISTORY,
+           **settings) -> dict:
+    """
+    Append a benchmark run to the history file under the current commit.
+
+    Args:
+        results: Results of one benchmark run (all for the same year)
+        path: History file to update
+        settings: Benchmark settings stored alongside the results
+
+    Returns:
+        The entry that was appended
+    """
+    return append_entry(path, results[0].year if results else None, settings, [
+        {
+            'day': r.day,
+            'part': r.part,
+            'answer': str(r.answer),
+            'parse': r.parse,
+            'solve': r.solve,
+        }
+        for r in results
+    ])
+
+
+def append_entry(path: Path, year: Optional[int], settings: dict,
+                 results: List[dict]) -> dict:
+    """
+    Append one run to a history file, keyed by the current commit.
+
+    The entry records when and on what the run was made, so histories of
+    different measurements (timings, memory) share one layout.
+    """
+    path = Path(path)
+    commit, dirty = git_revision()
+    entry = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'dirty': dirty,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'year': year,
+        'settings': settings,
+        'results': results,
+    }
+
+    history = load_history(path)
+    history.setdefault(commit, []).append(entry)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(history, f, indent=2)
+    tmp_path.replace(path)
+    return entry
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a unit that keeps three significant digits."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
@@ -0,0 +1,166 @@
+"""
+Persistent answer cache for the runner.
+
+Answers are stored in a small SQLite database keyed by (year, day, part),
+the SHA-256 of the puzzle input and a hash of the solver's source code.
+Editing a day module changes its hash, so only that day's answers are
+recomputed; everything else comes straight from the cache. The cache is
+bounded in size and evicts the least recently used answers first.
+"""
+
+import hashlib
+import inspect
+import pickle
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Tuple
+
+from aoc.runner import ROOT, load_day
+
+DEFAULT_PATH = ROOT / '.cache' / 'answers.sqlite3'
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Returned by AnswerCache.get when there is no entry (None is a valid answer)
+MISS = object()
+
+_solver_digests = {}
+
+
+def input_digest(input_text: str) -> str:
+    """SHA-256 of a puzzle input."""
+    return hashlib.sha256(input_text.encode()).hexdigest()
+
+
+def _source_files(module):
+    """
+    Source files a day module depends on: its own file plus every module
+    of this repository it imported or took functions from.
+    """
+    files = {Path(module.__file__).resolve()}
+    for value in vars(module).values():
+        if inspect.ismodule(value):
+            dependency = value
+        else:
+            dependency = sys.modules.get(getattr(value, '__module__', None) or '')
+        path = getattr(dependency, '__file__', None)
+        if path is None:
+            continue
+        path = Path(path).resolve()
+        if ROOT in path.parents:
+            files.add(path)
+    return sorted(files)
+
+
+def solver_digest(year: int, day: int) -> str:
+    """Hash of the source code behind a day's solutions."""
+    if (year, day) not in _solver_digests:
+        sha = hashlib.sha256()
+        for path in _source_files(load_day(year, day)):
+            sha.update(str(path.relative_to(ROOT)).encode())
+            sha.update(path.read_bytes())
+        _solver_digests[(year, day)] = sha.hexdigest()
+    return _solver_digests[(year, day)]
+
+
+class AnswerCache:
+    """
+    Size-bounded LRU store of answers on disk.
+
+    Args:
+        path: SQLite database file, created on first use
+        max_bytes: Evict least recently used answers beyond this total size
+    """
+
+    def __init__(self, path: Path = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " year INTEGER, day INTEGER, part INTEGER,"
+            " input_digest TEXT, solver_digest TEXT,"
+            " answer BLOB, size INTEGER, last_used REAL,"
+            " PRIMARY KEY (year, day, part, input_digest, solver_digest))"
+        )
+        self.db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    @staticmethod
+    def key(year: int, day: int, part: int, input_text: str) -> Tuple:
+        """Cache key of one (year, day, part) on the given input."""
+        return (year, day, part, input_digest(input_text), solver_digest(year, day))
+
+    def lookup(self, year: int, day: int, part: int, input_text: str) -> Tuple[Tuple, bool, object]:
+        """
+        Look up one job.
+
+        Returns:
+            Tuple of (key, hit, answer); store a computed answer under key
+        """
+        key = self.key(year, day, part, input_text)
+        answer = self.get(key)
+        if answer is MISS:
+            return key, False, None
+        return key, True, answer
+
+    def get(self, key: Tuple):
+        """Return the cached answer for ``key``, or MISS."""
+        row = self.db.execute(
+            "SELECT answer FROM answers WHERE year = ? AND day = ? AND part = ?"
+            " AND input_digest = ? AND solver_digest = ?", key).fetchone()
+        if row is None:
+            return MISS
+
+        self.db.execute(
+            "UPDATE answers SET last_used = ? WHERE year = ? AND day = ? AND part = ?"
+            " AND input_digest = ? AND solver_digest = ?", (time.time(), *key))
+        self.db.commit()
+        return pickle.loads(row[0])
+
+    def put(self, key: Tuple, answer):
+        """
+        Store an answer, replacing answers from older versions of the solver
+        for the same input, then evict down to the size bound.
+        """
+        year, day, part, input_hash, _ = key
+        blob = pickle.dumps(answer)
+        self.db.execute(
+            "DELETE FROM answers WHERE year = ? AND day = ? AND part = ? AND input_digest = ?",
+            (year, day, part, input_hash))
+        self.db.execute(
+            "INSERT INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (*key, blob, len(blob), time.time()))
+        self.evict()
+        self.db.commit()
+
+    def evict(self):
+        """Drop least recently used answers until the cache fits in max_bytes."""
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self.db.execute("SELECT rowid, size FROM answers ORDER BY last_used").fetchall()
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.db.execute("DELETE FROM answers WHERE rowid = ?", (rowid,))
+            total -= size
+
+    def clear(self):
+        """Remove every cached answer."""
+        self.db.execute("DELETE FROM answers")
+        self.db.commit()
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
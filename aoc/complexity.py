@@ -0,0 +1,184 @@
+"""
+Empirical complexity of the day solutions on synthetic inputs.
+
+Every day module provides ``generate(scale, seed=0)``, a seeded generator
+for inputs ``scale`` times the size of the real puzzle input. The report
+times parse and solve on a doubling ladder of scales and fits
+``log(time)`` against ``log(scale)``; the slope is the exponent ``k`` in
+``time ~ n^k``, so quadratic solvers show up long before production-sized
+data hits them:
+
+    python -m aoc scale 2025 --day 1-12 --max-scale 64
+"""
+
+import math
+import time
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from aoc.runner import call_in_child, jobs, load_day, phases_for
+
+# Timings below this are dominated by noise and left out of the fit
+MIN_FIT_TIME = 1e-3
+
+
+class Point(NamedTuple):
+    """Timings of one generated input, in seconds."""
+    scale: float
+    size: int
+    parse: float
+    solve: float
+
+
+class Fit(NamedTuple):
+    """Least-squares fit of log(time) against log(scale)."""
+    exponent: float
+    r_squared: float
+
+
+class ScalingResult(NamedTuple):
+    """Measured points and fitted exponents for one (day, part)."""
+    year: int
+    day: int
+    part: int
+    points: List[Point]
+    parse_fit: Optional[Fit]
+    solve_fit: Optional[Fit]
+    timed_out: Optional[float]
+
+
+def fit_exponent(scales: List[float], times: List[float]) -> Optional[Fit]:
+    """
+    Fit ``time = c * scale^k`` by least squares in log-log space.
+
+    Points faster than MIN_FIT_TIME are ignored. Returns None if fewer
+    than two points remain.
+    """
+    pairs = [(math.log(s), math.log(t)) for s, t in zip(scales, times) if t >= MIN_FIT_TIME]
+    if len(pairs) < 2:
+        return None
+
+    n = len(pairs)
+    mean_x = sum(x for x, _ in pairs) / n
+    mean_y = sum(y for _, y in pairs) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in pairs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    syy = sum((y - mean_y) ** 2 for _, y in pairs)
+    if sxx == 0:
+        return None
+
+    slope = sxy / sxx
+    r_squared = (sxy * sxy) / (sxx * syy) if syy > 0 else 1.0
+    return Fit(slope, r_squared)
+
+
+def classify(fit: Optional[Fit]) -> str:
+    """Describe a fitted exponent in words."""
+    if fit is None:
+        return 'too fast to fit'
+    k = fit.exponent
+    if k < 0.5:
+        return 'constant'
+    if k < 1.25:
+        return 'linear'
+    if k < 1.75:
+        return 'superlinear'
+    if k < 2.5:
+        return 'quadratic'
+    return 'cubic or worse'
+
+
+def _time_generated(year: int, day: int, part: int, scale: float, seed: int,
+                    repeat: int, budget: float) -> Point:
+    """Generate one input and time it; runs in a child process."""
+    parse, solve = phases_for(year, day, part)
+    input_text = load_day(year, day).generate(scale, seed)
+
+    # Best of a few runs, as long as they fit in the budget
+    best_parse = best_solve = math.inf
+    spent = 0.0
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        data = parse(input_text)
+        t1 = time.perf_counter()
+        solve(data)
+        t2 = time.perf_counter()
+
+        best_parse = min(best_parse, t1 - t0)
+        best_solve = min(best_solve, t2 - t1)
+        spent += t2 - t0
+        if spent >= budget:
+            break
+    return Point(scale, len(input_text), best_parse, best_solve)
+
+
+def measure(year: int, day: int, part: int, scale: float, seed: int = 0,
+            timeout: Optional[float] = None, repeat: int = 3,
+            budget: float = 2.0) -> Optional[Point]:
+    """
+    Time one generated input in a child process.
+
+    The input is solved up to ``repeat`` times while the runs stay within
+    ``budget`` seconds, and the fastest run is kept.
+
+    Returns None if the child did not finish within ``timeout`` seconds.
+    """
+    try:
+        return call_in_child(_time_generated, year, day, part, scale, seed, repeat, budget,
+                             timeout=timeout)
+    except TimeoutError:
+        return None
+
+
+def scaling(year: int, day: int, part: int, start: float = 1 / 16,
+            max_scale: float = 64, budget: float = 2.0,
+            timeout: Optional[float] = None,
+            seed: int = 0) -> Tuple[List[Point], Optional[float]]:
+    """
+    Time one part on a doubling ladder of scales.
+
+    The ladder stops after the first input that took longer than
+    ``budget`` seconds, or that did not finish within ``timeout`` seconds
+    (default: ten times the budget).
+
+    Returns:
+        Tuple of (points, scale that timed out or None)
+    """
+    if timeout is None:
+        timeout = 10 * budget
+
+    points = []
+    scale = start
+    while scale <= max_scale:
+        point = measure(year, day, part, scale, seed, timeout, budget=budget)
+        if point is None:
+            return points, scale
+        points.append(point)
+        if point.parse + point.solve > budget:
+            break
+        scale *= 2
+    return points, None
+
+
+def report(year: int, days: List[int], parts: List[int], start: float = 1 / 16,
+           max_scale: float = 64, budget: float = 2.0,
+           timeout: Optional[float] = None, seed: int = 0) -> Iterator[ScalingResult]:
+    """
+    Measure and fit the selected days and parts one after another.
+
+    Yields:
+        One ScalingResult per (day, part)
+    """
+    for day, part in jobs(year, days, parts):
+        if phases_for(year, day, part) is None:
+            continue
+        if not hasattr(load_day(year, day), 'generate'):
+            continue
+
+        points, timed_out = scaling(year, day, part, start, max_scale, budget, timeout, seed)
+        scales = [p.scale for p in points]
+        yield ScalingResult(
+            year, day, part, points,
+            fit_exponent(scales, [p.parse for p in points]),
+            fit_exponent(scales, [p.solve for p in points]),
+            timed_out,
+        )
@@ -0,0 +1,236 @@
+"""
+Peak memory of the parse and solve phases.
+
+Every (day, part) is measured in a fresh child process so that the
+process-wide high-water mark (max-RSS) belongs to that job alone:
+
+    python -m aoc memory 2025 --day 8 --top 5
+
+For each phase the report gives the tracemalloc peak, i.e. the most
+memory Python objects allocated during the phase held at any one time,
+the process max-RSS at the end of the phase, and the source lines that
+had allocated the most when the phase was closest to its peak. A
+background thread snapshots the traced allocations every time they grow
+by half, so short-lived structures that are freed again before the
+phase returns, like d08's heap of pairwise distances, still show up.
+Tracing and snapshots cost memory of their own, so max-RSS is taken
+from a separate untraced run first.
+
+Results are appended to ``benchmarks/memory.json`` under the current
+commit so that growth can be tracked over time. ``--scale`` measures a
+generated input instead of the real one to show how memory grows with
+input size.
+"""
+
+import _weakrefset
+import linecache
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from aoc import bench
+from aoc.runner import ROOT, call_in_child, jobs, load_day, phases_for, read_input
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_HISTORY = ROOT / 'benchmarks' / 'memory.json'
+
+# Take a new peak snapshot when traced memory grows by this factor
+SNAPSHOT_GROWTH = 1.5
+SAMPLE_INTERVAL = 0.005
+
+
+class Site(NamedTuple):
+    """Source line and the memory allocated there."""
+    location: str
+    size: int
+    count: int
+
+
+class PhaseMemory(NamedTuple):
+    """Memory used by one phase, in bytes."""
+    peak: int
+    max_rss: Optional[int]
+    top: List[Site]
+
+
+class MemoryResult(NamedTuple):
+    """Memory of the parse and solve phases of one (day, part)."""
+    year: int
+    day: int
+    part: int
+    answer: object
+    parse: PhaseMemory
+    solve: PhaseMemory
+
+
+def max_rss() -> Optional[int]:
+    """High-water mark of this process's resident set size in bytes."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024  # kilobytes elsewhere
+
+
+class _PeakSampler(threading.Thread):
+    """Snapshot traced allocations whenever they reach a new high."""
+
+    def __init__(self, baseline: int):
+        super().__init__(daemon=True)
+        self.best = baseline
+        self.snapshot = None
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(SAMPLE_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.best * SNAPSHOT_GROWTH:
+                self.best = current
+                self.snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def _top_sites(snapshot, start, limit: int) -> List[Site]:
+    """Lines that allocated the most between two snapshots."""
+    if limit <= 0:
+        return []
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__),
+              tracemalloc.Filter(False, threading.__file__),
+              tracemalloc.Filter(False, linecache.__file__),
+              tracemalloc.Filter(False, _weakrefset.__file__),
+              tracemalloc.Filter(False, __file__)]
+    snapshot = snapshot.filter_traces(ignore)
+    start = start.filter_traces(ignore)
+
+    sites = []
+    for stat in snapshot.compare_to(start, 'lineno'):
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        sites.append(Site(f"{Path(frame.filename).name}:{frame.lineno}",
+                          stat.size_diff, stat.count_diff))
+        if len(sites) == limit:
+            break
+    return sites
+
+
+def measure_phase(func: Callable, arg, top: int = 5) -> Tuple[object, PhaseMemory]:
+    """
+    Call ``func(arg)`` under tracemalloc, which must already be tracing.
+
+    Returns:
+        Tuple of (return value, memory of the call)
+    """
+    start = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    sampler = _PeakSampler(baseline)
+    sampler.start()
+    try:
+        value = func(arg)
+    finally:
+        sampler.stop()
+
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = sampler.snapshot
+    if snapshot is None or current >= sampler.best:
+        snapshot = tracemalloc.take_snapshot()
+
+    return value, PhaseMemory(peak - baseline, None, _top_sites(snapshot, start, top))
+
+
+def _measure_job(year: int, day: int, part: int, scale: Optional[float],
+                 seed: int, top: int) -> MemoryResult:
+    """Measure one (day, part); runs in a child process."""
+    parse, solve = phases_for(year, day, part)
+    if scale is None:
+        input_text = read_input(year, day)
+    else:
+        input_text = load_day(year, day).generate(scale, seed)
+
+    # Untraced run for the process high-water marks
+    data = parse(input_text)
+    parse_rss = max_rss()
+    solve(data)
+    solve_rss = max_rss()
+    del data
+
+    tracemalloc.start()
+    data, parse_memory = measure_phase(parse, input_text, top)
+    answer, solve_memory = measure_phase(solve, data, top)
+    tracemalloc.stop()
+    return MemoryResult(year, day, part, answer,
+                        parse_memory._replace(max_rss=parse_rss),
+                        solve_memory._replace(max_rss=solve_rss))
+
+
+def measure(year: int, day: int, part: int, scale: Optional[float] = None,
+            seed: int = 0, top: int = 5,
+            timeout: Optional[float] = None) -> Optional[MemoryResult]:
+    """
+    Measure one (day, part) in a fresh child process.
+
+    Args:
+        scale: Measure ``generate(scale, seed)`` instead of the real input
+
+    Returns:
+        The measurement, or None if it did not finish within ``timeout``
+    """
+    try:
+        return call_in_child(_measure_job, year, day, part, scale, seed, top,
+                             timeout=timeout)
+    except TimeoutError:
+        return None
+
+
+def report(year: int, days: List[int], parts: List[int], scale: Optional[float] = None,
+           seed: int = 0, top: int = 5,
+           timeout: Optional[float] = None) -> Iterator[Tuple[int, int, Optional[MemoryResult]]]:
+    """
+    Measure the selected days and parts one after another.
+
+    Yields:
+        Tuple of (day, part, MemoryResult or None if it timed out)
+    """
+    for day, part in jobs(year, days, parts):
+        if phases_for(year, day, part) is None:
+            continue
+        if scale is not None and not hasattr(load_day(year, day), 'generate'):
+            continue
+        yield day, part, measure(year, day, part, scale, seed, top, timeout)
+
+
+def record(results: List[MemoryResult], path: Path = DEFAULT_HISTORY, **settings) -> dict:
+    """Append a memory run to the history file under the current commit."""
+    return bench.append_entry(path, results[0].year if results else None, settings, [
+        {
+            'day': r.day,
+            'part': r.part,
+            'answer': str(r.answer),
+            'parse': {'peak': r.parse.peak, 'max_rss': r.parse.max_rss,
+                      'top': [list(site) for site in r.parse.top]},
+            'solve': {'peak': r.solve.peak, 'max_rss': r.solve.max_rss,
+                      'top': [list(site) for site in r.solve.top]},
+        }
+        for r in results
+    ])
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Format a byte count with a binary unit."""
+    if size is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.2f}GiB"
@@ -0,0 +1,101 @@
+"""
+Lightweight counters, gauges and timers for instrumenting solvers.
+
+Solvers report what they do instead of printing progress:
+
+    from aoc import metrics
+
+    metrics.incr('masks', 1 << len(free_vars))   # counter
+    metrics.gauge('active_beams', len(beams))    # last value wins
+    with metrics.timer('solve_region'):          # count and total seconds
+        ...
+
+Recording is off by default and every call returns immediately, so
+instrumented code costs next to nothing in normal runs. For recursive
+helpers that are too hot even for that, wrap the function only when
+recording is on; the wrapped name is what the recursion calls:
+
+    if metrics.enabled:
+        dfs = metrics.counted('dfs_calls', dfs)
+
+``python -m aoc run 2025 --metrics`` turns recording on, collects one
+snapshot per (day, part) and dumps them as JSON at the end of the run.
+"""
+
+import functools
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict
+
+enabled = False
+
+_counters: Dict[str, int] = {}
+_gauges: Dict[str, float] = {}
+_timers: Dict[str, Dict[str, float]] = {}
+
+_NULL_TIMER = nullcontext()
+
+
+def enable(on: bool = True):
+    """Switch recording on or off."""
+    global enabled
+    enabled = on
+
+
+def reset():
+    """Forget everything recorded so far."""
+    _counters.clear()
+    _gauges.clear()
+    _timers.clear()
+
+
+def incr(name: str, n: int = 1):
+    """Add ``n`` to a counter."""
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def gauge(name: str, value: float):
+    """Set a gauge to its latest value."""
+    if enabled:
+        _gauges[name] = value
+
+
+def peak(name: str, value: float):
+    """Raise a gauge to ``value`` if that is higher than what it holds."""
+    if enabled and value > _gauges.get(name, value - 1):
+        _gauges[name] = value
+
+
+@contextmanager
+def _timed(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = _timers.setdefault(name, {'count': 0, 'total': 0.0})
+        entry['count'] += 1
+        entry['total'] += time.perf_counter() - start
+
+
+def timer(name: str):
+    """Context manager adding one call and its duration to a timer."""
+    return _timed(name) if enabled else _NULL_TIMER
+
+
+def counted(name: str, func: Callable) -> Callable:
+    """Wrap ``func`` so that every call increments counter ``name``."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _counters[name] = _counters.get(name, 0) + 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def snapshot() -> dict:
+    """Copy of everything recorded, ready for JSON."""
+    return {
+        'counters': dict(_counters),
+        'gauges': dict(_gauges),
+        'timers': {name: dict(entry) for name, entry in _timers.items()},
+    }
@@ -0,0 +1,200 @@
+"""
+Fast integer extraction for puzzle inputs.
+
+Most inputs are integers separated by punctuation (``x,y,z`` lines,
+``a-b`` ranges, ``L68`` rotations). Instead of splitting lines and
+calling ``int()`` on every token, the helpers here work on the raw bytes:
+one ``bytes.translate`` turns every non-digit into a space, one
+``split()`` cuts the tokens and ``int()`` parses each of them in C. The
+result is a flat ``array('q')`` of 64-bit integers, which can be cut into
+columns or rows, or viewed as a NumPy buffer without copying:
+
+    values = ints(input_text)           # array('q', [1, 2, 3, 4, ...])
+    xs, ys = columns(values, 2)         # every other value
+    points = rows(values, 2)            # [(1, 2), (3, 4), ...]
+
+When NumPy is installed, large inputs skip the per-token ``int()``
+calls altogether: digits are located, weighted by powers of ten and
+summed per number with array operations.
+
+For inputs larger than memory, ``iter_ints`` memory-maps a file and
+yields the integers chunk by chunk, and ``chunk_ranges`` cuts a file into
+line-aligned byte ranges for worker processes.
+"""
+
+import mmap
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_CHUNK_SIZE = 1 << 24
+
+# Inputs at least this large are parsed with NumPy when it is available
+NUMPY_MIN_BYTES = 1 << 16
+
+# Longest number the NumPy parser handles; int64 holds up to 9.2e18
+_MAX_NUMPY_DIGITS = 18
+_POWERS_OF_TEN = None if np is None else 10 ** np.arange(_MAX_NUMPY_DIGITS, dtype=np.int64)
+
+# Every byte except the digits (and optionally '-') becomes a space
+_DIGITS = b'0123456789'
+_UNSIGNED = bytes(c if c in _DIGITS else ord(' ') for c in range(256))
+_SIGNED = bytes(c if c in _DIGITS or c == ord('-') else ord(' ') for c in range(256))
+
+Buffer = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+
+def as_bytes(data: Buffer) -> bytes:
+    """Return puzzle input as bytes; bytes pass through unchanged."""
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, bytes):
+        return data
+    return bytes(data)
+
+
+def ints(data: Buffer, signed: bool = False) -> array:
+    """
+    Extract every integer from an input, in order.
+
+    Args:
+        data: Puzzle input as text, bytes or a memory map
+        signed: Treat '-' as a minus sign. Leave this off for inputs that
+                use '-' as a separator, such as ``10-14`` ranges
+
+    Returns:
+        array('q') of the integers
+    """
+    data = as_bytes(data)
+    if np is not None and len(data) >= NUMPY_MIN_BYTES:
+        values = _ints_numpy(data, signed)
+        if values is not None:
+            return values
+    table = _SIGNED if signed else _UNSIGNED
+    return array('q', list(map(int, data.translate(table).split())))
+
+
+def _ints_numpy(data: bytes, signed: bool) -> Union[array, None]:
+    """
+    Vectorized ``ints``; returns None for numbers too long for int64.
+
+    Every digit is weighted by ten to the power of its distance from the
+    end of its number, and the weighted digits are summed per number.
+    """
+    chars = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (chars >= ord('0')) & (chars <= ord('9'))
+    edges = np.diff(is_digit.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return array('q')
+
+    lengths = ends - starts
+    if lengths.max() > _MAX_NUMPY_DIGITS:
+        return None
+
+    positions = np.flatnonzero(is_digit)
+    exponents = np.repeat(ends - 1, lengths) - positions
+    weighted = (chars[positions] - ord('0')).astype(np.int64) * _POWERS_OF_TEN[exponents]
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    numbers = np.add.reduceat(weighted, offsets)
+
+    if signed:
+        negative = np.zeros(len(starts), dtype=bool)
+        negative[starts > 0] = chars[starts[starts > 0] - 1] == ord('-')
+        numbers[negative] *= -1
+
+    values = array('q')
+    values.frombytes(numbers.tobytes())
+    return values
+
+
+def columns(values: array, width: int) -> Tuple[array, ...]:
+    """Split a flat array of ``width`` integers per record into columns."""
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not form records of {width}")
+    return tuple(values[i::width] for i in range(width))
+
+
+def rows(values: array, width: int) -> List[Tuple[int, ...]]:
+    """Split a flat array of ``width`` integers per record into tuples."""
+    return list(zip(*columns(values, width)))
+
+
+def to_numpy(values: array):
+    """
+    View an array('q') as an int64 NumPy array without copying.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("to_numpy requires numpy")
+    return np.frombuffer(values, dtype=np.int64)
+
+
+@contextmanager
+def map_file(path: Union[str, Path]) -> Iterator[Buffer]:
+    """Memory-map a file read-only; empty files give an empty bytes object."""
+    with open(path, 'rb') as f:
+        if Path(path).stat().st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def chunk_ranges(path: Union[str, Path], chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into about ``chunks`` byte ranges that end on line breaks.
+
+    Workers can then parse ``mapped[start:end]`` of their own range
+    without ever seeing half a line.
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file
+    """
+    size = Path(path).stat().st_size
+    if size == 0:
+        return []
+    with map_file(path) as mapped:
+        bounds = [0]
+        for i in range(1, chunks):
+            cut = mapped.find(b'\n', max(bounds[-1], size * i // chunks))
+            if cut == -1:
+                break
+            if cut + 1 > bounds[-1]:
+                bounds.append(cut + 1)
+        if bounds[-1] < size:
+            bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def iter_ints(path: Union[str, Path], signed: bool = False,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[array]:
+    """
+    Extract the integers of a file in chunks of about ``chunk_size`` bytes.
+
+    The file is memory-mapped, so only the chunk being parsed is held in
+    memory. A number cut in half at the end of a chunk is carried over to
+    the next one.
+
+    Yields:
+        array('q') of the integers in each chunk
+    """
+    table = _SIGNED if signed else _UNSIGNED
+    with map_file(path) as mapped:
+        carry = b''
+        for offset in range(0, len(mapped), chunk_size):
+            chunk = carry + mapped[offset:offset + chunk_size].translate(table)
+            cut = chunk.rfind(b' ') + 1
+            carry = chunk[cut:]
+            yield array('q', list(map(int, chunk[:cut].split())))
+        if carry:
+            yield array('q', list(map(int, carry.split())))
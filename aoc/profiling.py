@@ -0,0 +1,137 @@
+"""
+Deterministic profiling of single (day, part) runs.
+
+``python -m aoc run 2025 --day 12 --profile`` solves the selected parts
+under cProfile and, for each of them, prints the top of a pstats summary
+and writes two files to ``profiles/``:
+
+    2025-d12-p1.prof        raw pstats data (snakeviz, pstats.Stats)
+    2025-d12-p1.collapsed   one "frame;frame;frame microseconds" line per
+                            stack, for flamegraph.pl or speedscope
+
+cProfile records caller/callee pairs rather than whole stacks, so the
+collapsed stacks are rebuilt from the call graph: a function's time is
+split across its callers in proportion to the time each of them spent
+calling it. Recursive calls are folded into the outermost frame.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from aoc.runner import ROOT, Result, read_input, solver_for
+
+DEFAULT_DIR = ROOT / 'profiles'
+
+# Stacks deeper than this, or worth less than this many seconds, are cut
+# off in the collapsed output
+MAX_DEPTH = 100
+MIN_SECONDS = 1e-6
+
+Function = Tuple[str, int, str]
+
+
+class Profile(NamedTuple):
+    """Result of one profiled run and where its reports were written."""
+    result: Result
+    stats: pstats.Stats
+    stats_path: Path
+    collapsed_path: Path
+
+
+def frame_name(func: Function) -> str:
+    """Short label of a pstats function key, e.g. ``d12.solve_region``."""
+    filename, _, name = func
+    if filename == '~':  # built-ins are keyed as ('~', 0, '<built-in method len>')
+        label = name.strip('<>')
+    else:
+        label = f"{Path(filename).stem}.{name}"
+    return label.replace(';', ':')
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Rebuild approximate call stacks from a cProfile call graph.
+
+    Returns:
+        Dictionary mapping "root;...;leaf" to seconds spent in the leaf
+        itself along that stack
+    """
+    table = stats.stats
+    callees: Dict[Function, List[Function]] = {func: [] for func in table}
+    for func, (_, _, _, _, callers) in table.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+
+    stacks: Dict[str, float] = {}
+
+    def visit(func: Function, path: List[Function], weight: float):
+        _, _, tottime, cumtime, _ = table[func]
+        key = ';'.join(frame_name(f) for f in path)
+        stacks[key] = stacks.get(key, 0.0) + weight * tottime
+        if len(path) >= MAX_DEPTH or weight * cumtime < MIN_SECONDS:
+            return
+        for callee in callees.get(func, ()):
+            if callee in path:
+                continue
+            edge_cumtime = table[callee][4][func][3]
+            callee_cumtime = table[callee][3]
+            if callee_cumtime <= 0 or edge_cumtime <= 0:
+                continue
+            visit(callee, path + [callee], weight * edge_cumtime / callee_cumtime)
+
+    roots = [func for func, (_, _, _, _, callers) in table.items() if not callers]
+    for root in roots:
+        visit(root, [root], 1.0)
+    return {key: seconds for key, seconds in stacks.items() if seconds > 0}
+
+
+def write_collapsed(stats: pstats.Stats, path: Path):
+    """Write collapsed stacks with integer microsecond weights."""
+    with open(path, 'w') as f:
+        for key, seconds in sorted(collapsed_stacks(stats).items()):
+            micros = round(seconds * 1e6)
+            if micros > 0:
+                f.write(f"{key} {micros}\n")
+
+
+def summary(stats: pstats.Stats, sort: str = 'cumulative', limit: int = 25) -> str:
+    """pstats table of the ``limit`` most expensive functions."""
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def profile_job(year: int, day: int, part: int, directory: Path = DEFAULT_DIR) -> Profile:
+    """Solve one (day, part) under cProfile and write its reports."""
+    input_text = read_input(year, day)
+    solver = solver_for(year, day, part)
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    answer = profiler.runcall(solver, input_text)
+    cpu = time.process_time() - cpu_start
+    elapsed = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"{year}-d{day:02d}-p{part}"
+    stats_path = directory / f"{stem}.prof"
+    collapsed_path = directory / f"{stem}.collapsed"
+    stats.dump_stats(stats_path)
+    write_collapsed(stats, collapsed_path)
+
+    return Profile(Result(year, day, part, answer, elapsed, cpu), stats, stats_path, collapsed_path)
+
+
+def profile(year: int, selected: List[Tuple[int, int]],
+            directory: Path = DEFAULT_DIR) -> Iterator[Profile]:
+    """Profile the given (day, part) jobs one after another."""
+    for day, part in selected:
+        yield profile_job(year, day, part, directory)
@@ -0,0 +1,524 @@
+"""
+Locate, load and run the day solutions.
+
+Day modules are plain scripts in directories such as ``2025/d01`` that are
+not importable as packages, so they are loaded straight from their file
+path. Inputs are resolved relative to the module, never to the current
+working directory.
+
+Every day module exposes ``part1(input_text)`` and, except for the last
+day of a year, ``part2(input_text)``. For timing the phases separately a
+part is also split into ``parse(input_text)`` (or a part specific
+``parse1`` / ``parse2``) and ``solve1(data)`` / ``solve2(data)``, so that
+``partN(text) == solveN(parse(text))``.
+"""
+
+import importlib.util
+import json
+import math
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from aoc import metrics
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Repository root: the directory that holds the per-year folders
+ROOT = Path(__file__).resolve().parent.parent
+
+
+# Wall-clock time of every job of the last run, used to schedule the next one
+TIMINGS_PATH = ROOT / 'benchmarks' / 'timings.json'
+
+# Result.status of jobs that did not produce an answer
+OK = 'ok'
+TIMEOUT = 'TIMEOUT'
+OOM = 'OOM'
+
+
+class Result(NamedTuple):
+    """Answer, wall-clock and CPU time for one (year, day, part) job."""
+    year: int
+    day: int
+    part: int
+    answer: object
+    elapsed: float
+    cpu: float = 0.0
+    cached: bool = False
+    metrics: Optional[dict] = None
+    status: str = OK
+
+
+def day_dir(year: int, day: int) -> Path:
+    """Return the directory holding the solution for the given day."""
+    return ROOT / str(year) / f'd{day:02d}'
+
+
+def call_day(year: int, day: int, name: str, *args):
+    """
+    Call function ``name`` of a day module with ``args``.
+
+    Day modules are registered under made-up names such as
+    ``aoc_2025_d01``, so their functions only unpickle in forked
+    children. Process pools submit this function instead, which loads
+    the module in the worker whatever the start method.
+    """
+    return getattr(load_day(year, day), name)(*args)
+
+
+def map_day(year: int, day: int, name: str, calls: Iterable[tuple],
+            workers: Optional[int] = None) -> Iterator:
+    """
+    Call function ``name`` of a day module in a process pool, once per
+    tuple of arguments in ``calls``.
+
+    Works under every multiprocessing start method: workers load the
+    module through ``call_day``, and the module is loaded here too so
+    that results holding its classes unpickle.
+
+    Yields:
+        The return values, in the order of ``calls``
+    """
+    load_day(year, day)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call_day, year, day, name, *args) for args in calls]
+        for future in futures:
+            yield future.result()
+
+
+def input_path(year: int, day: int) -> Path:
+    """Return the absolute path of the puzzle input for the given day."""
+    return day_dir(year, day) / 'input'
+
+
+def read_input(year: int, day: int) -> str:
+    """Read the puzzle input for the given day."""
+    with open(input_path(year, day), 'r') as f:
+        return f.read()
+
+
+def load_day(year: int, day: int):
+    """
+    Import the solution module for the given day.
+
+    Modules are cached in ``sys.modules`` under ``aoc_<year>_dXX`` so that
+    repeated lookups (and pickling of their functions) resolve to the same
+    object.
+    """
+    name = f'aoc_{year}_d{day:02d}'
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = day_dir(year, day) / f'd{day:02d}.py'
+    if not path.exists():
+        raise FileNotFoundError(f"No solution for {year} day {day}: {path}")
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def solver_for(year: int, day: int, part: int) -> Callable[[str], object]:
+    """
+    Return the ``part1`` / ``part2`` function of a day module.
+
+    Returns None if the day has no such part (e.g. the last day of a year).
+    """
+    return getattr(load_day(year, day), f'part{part}', None)
+
+
+def phases_for(year: int, day: int, part: int) -> Optional[Tuple[Callable, Callable]]:
+    """
+    Return the ``(parse, solve)`` functions of one part of a day module.
+
+    Returns None if the day has no such part.
+    """
+    module = load_day(year, day)
+    parse = getattr(module, f'parse{part}', None) or getattr(module, 'parse', None)
+    solve = getattr(module, f'solve{part}', None)
+    if parse is None or solve is None:
+        return None
+    return parse, solve
+
+
+def parse_days(spec: str) -> List[int]:
+    """
+    Parse a day selection such as ``"1-12"``, ``"3"`` or ``"1,4,9-11"``.
+
+    Returns:
+        Sorted list of unique day numbers
+    """
+    days = set()
+    for chunk in spec.split(','):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if '-' in chunk:
+            start, end = map(int, chunk.split('-'))
+            days.update(range(start, end + 1))
+        else:
+            days.add(int(chunk))
+
+    for day in days:
+        if not 1 <= day <= 25:
+            raise ValueError(f"Day out of range: {day}")
+    return sorted(days)
+
+
+def parse_parts(spec: str) -> List[int]:
+    """Parse a part selection such as ``"1,2"`` or ``"2"``."""
+    parts = sorted({int(p) for p in spec.split(',') if p.strip()})
+    for part in parts:
+        if part not in (1, 2):
+            raise ValueError(f"Part must be 1 or 2: {part}")
+    return parts
+
+
+def parse_size(spec: str) -> int:
+    """Parse a memory size such as ``"512M"``, ``"2G"`` or ``"1048576"`` into bytes."""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+    spec = spec.strip().upper().rstrip('B').rstrip('I')
+    if spec and spec[-1] in units:
+        size = float(spec[:-1]) * units[spec[-1]]
+    else:
+        size = float(spec)
+    if size <= 0:
+        raise ValueError(f"Memory size must be positive: {spec}")
+    return int(size)
+
+
+def jobs(year: int, days: List[int], parts: List[int]) -> List[Tuple[int, int]]:
+    """
+    List the (day, part) pairs that can actually be solved.
+
+    Days without a solution module, input file or requested part are
+    skipped silently so that ranges like ``1-25`` work on partial years.
+    """
+    selected = []
+    for day in days:
+        if not (day_dir(year, day) / f'd{day:02d}.py').exists():
+            continue
+        if not input_path(year, day).exists():
+            continue
+        for part in parts:
+            if solver_for(year, day, part) is not None:
+                selected.append((day, part))
+    return selected
+
+
+def solve_job(year: int, day: int, part: int, collect_metrics: bool = False) -> Result:
+    """
+    Read the input and solve one (day, part) in the current process.
+
+    This is the unit of work handed to pool workers, so it only takes
+    picklable arguments and loads the day module itself. With
+    ``collect_metrics`` the solver's counters, gauges and timers are
+    recorded and returned with the result.
+    """
+    input_text = read_input(year, day)
+    solver = solver_for(year, day, part)
+
+    metrics.reset()
+    metrics.enable(collect_metrics)
+    try:
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        answer = solver(input_text)
+        cpu = time.process_time() - cpu_start
+        elapsed = time.perf_counter() - start
+    finally:
+        metrics.enable(False)
+
+    recorded = metrics.snapshot() if collect_metrics else None
+    return Result(year, day, part, answer, elapsed, cpu, metrics=recorded)
+
+
+def run(year: int, days: List[int], parts: List[int], cache=None,
+        collect_metrics: bool = False) -> Iterator[Result]:
+    """
+    Solve the selected days and parts one after another.
+
+    Args:
+        cache: Optional ``aoc.cache.AnswerCache``; hits are returned
+               without running the solver and misses are stored
+        collect_metrics: Record solver metrics into each Result
+
+    Yields:
+        One Result per solved (day, part)
+    """
+    for day, part in jobs(year, days, parts):
+        if cache is None:
+            yield solve_job(year, day, part, collect_metrics)
+            continue
+
+        start = time.perf_counter()
+        key, hit, answer = cache.lookup(year, day, part, read_input(year, day))
+        if hit:
+            yield Result(year, day, part, answer, time.perf_counter() - start, cached=True)
+            continue
+
+        result = solve_job(year, day, part, collect_metrics)
+        cache.put(key, result.answer)
+        yield result
+
+
+def longest_first(selected: List[Tuple[int, int]],
+                  estimates: Dict[Tuple[int, int], float]) -> List[Tuple[int, int]]:
+    """
+    Order jobs by decreasing estimated run time.
+
+    Jobs without an estimate go first: they may well be the slow ones, and
+    starting them early keeps them from becoming the tail of the batch.
+    """
+    return sorted(selected, key=lambda job: estimates.get(job, math.inf), reverse=True)
+
+
+def run_parallel(year: int, days: List[int], parts: List[int],
+                 workers: Optional[int] = None,
+                 estimates: Optional[Dict[Tuple[int, int], float]] = None,
+                 cache=None, collect_metrics: bool = False,
+                 timeout: Optional[float] = None,
+                 memory_limit: Optional[int] = None) -> Iterator[Result]:
+    """
+    Solve the selected days and parts on a process pool.
+
+    Jobs are submitted longest first according to ``estimates`` (seconds
+    per (day, part)) so that the slow days start immediately instead of
+    finishing last on a single core. Answers found in ``cache`` are
+    yielded before anything is submitted. ``collect_metrics`` works as
+    for ``run``; the metrics are recorded in the worker processes.
+
+    With a ``timeout`` (seconds) or ``memory_limit`` (bytes of address
+    space) every job runs in a process of its own that is killed when it
+    overruns, and is reported with status TIMEOUT or OOM instead of an
+    answer while the other jobs carry on.
+
+    Yields:
+        One Result per solved (day, part), in order of completion
+    """
+    pending = []
+    for day, part in longest_first(jobs(year, days, parts), estimates or {}):
+        if cache is None:
+            pending.append((None, day, part))
+            continue
+
+        start = time.perf_counter()
+        key, hit, answer = cache.lookup(year, day, part, read_input(year, day))
+        if hit:
+            yield Result(year, day, part, answer, time.perf_counter() - start, cached=True)
+        else:
+            pending.append((key, day, part))
+
+    if not pending:
+        return
+
+    if timeout is None and memory_limit is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(solve_job, year, day, part, collect_metrics): key
+                       for key, day, part in pending}
+            for future in as_completed(futures):
+                result = future.result()
+                if cache is not None:
+                    cache.put(futures[future], result.answer)
+                yield result
+        return
+
+    for key, result in run_limited(year, pending, workers, timeout, memory_limit, collect_metrics):
+        if cache is not None and result.status == OK:
+            cache.put(key, result.answer)
+        yield result
+
+
+def _child_main(func: Callable, args: tuple, quiet: bool, conn):
+    """Send ``func(*args)``, or the exception it raised, to the parent."""
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')  # keep solver chatter out of reports
+    try:
+        conn.send(func(*args))
+    except MemoryError:
+        try:
+            conn.send(OOM)
+        except MemoryError:
+            pass  # the parent treats a silent exit under a memory limit as OOM
+    except BaseException as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+def start_child(func: Callable, args: tuple = (), quiet: bool = False):
+    """
+    Start ``func(*args)`` in a fresh child process.
+
+    ``func`` must be importable by the child (a module-level function of
+    the ``aoc`` package), whichever start method multiprocessing uses.
+
+    Args:
+        quiet: Send the child's standard output to the null device
+
+    Returns:
+        Tuple of (process, receiving end of a pipe). The pipe delivers the
+        return value, the exception raised, or OOM if the child ran out
+        of memory
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_child_main, args=(func, args, quiet, sender))
+    process.start()
+    sender.close()
+    return process, receiver
+
+
+def call_in_child(func: Callable, *args, timeout: Optional[float] = None,
+                  quiet: bool = True):
+    """
+    Call ``func(*args)`` in a fresh child process and return its result.
+
+    Running in a fresh process gives the call its own high-water marks and
+    lets a runaway call be killed.
+
+    Raises:
+        TimeoutError: If the child did not finish within ``timeout`` seconds
+        MemoryError: If the child ran out of memory
+        Whatever ``func`` raised in the child
+    """
+    process, receiver = start_child(func, args, quiet)
+    try:
+        if not receiver.poll(timeout):
+            raise TimeoutError(f"{func.__name__} did not finish within {timeout:g}s")
+        outcome = receiver.recv()
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+
+    if isinstance(outcome, BaseException):
+        raise outcome
+    if isinstance(outcome, str) and outcome == OOM:
+        raise MemoryError(f"{func.__name__} ran out of memory")
+    return outcome
+
+
+def _solve_limited(year: int, day: int, part: int, collect_metrics: bool,
+                   memory_limit: Optional[int]) -> Result:
+    """Solve one job under an address-space limit; runs in a child process."""
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    return solve_job(year, day, part, collect_metrics)
+
+
+def run_limited(year: int, pending: List[Tuple[object, int, int]],
+                workers: Optional[int] = None, timeout: Optional[float] = None,
+                memory_limit: Optional[int] = None,
+                collect_metrics: bool = False) -> Iterator[Tuple[object, Result]]:
+    """
+    Solve jobs in one child process each, enforcing time and memory limits.
+
+    Args:
+        pending: (key, day, part) triples in the order to start them; the
+                 key is handed back with the result
+        workers: Maximum number of jobs running at once (default: all cores)
+        timeout: Wall-clock seconds after which a job is killed
+        memory_limit: RLIMIT_AS in bytes for every job
+
+    Yields:
+        Tuples of (key, Result) in order of completion
+    """
+    if memory_limit is not None and resource is None:
+        raise ValueError("Memory limits need the resource module, which this platform lacks")
+
+    queue = list(reversed(pending))
+    workers = workers or os.cpu_count() or 1
+    active = {}  # receiving end of the pipe -> (process, key, day, part, start)
+    try:
+        while queue or active:
+            while queue and len(active) < workers:
+                key, day, part = queue.pop()
+                process, receiver = start_child(
+                    _solve_limited, (year, day, part, collect_metrics, memory_limit))
+                active[receiver] = (process, key, day, part, time.perf_counter())
+
+            wait = None
+            if timeout is not None:
+                first_deadline = min(start for *_, start in active.values()) + timeout
+                wait = max(0.0, first_deadline - time.perf_counter())
+
+            for receiver in multiprocessing.connection.wait(list(active), wait):
+                process, key, day, part, start = active.pop(receiver)
+                try:
+                    outcome = receiver.recv()
+                except EOFError:  # died without reporting, e.g. killed on allocation failure
+                    outcome = None
+                elapsed = time.perf_counter() - start
+                receiver.close()
+                process.join()
+
+                if isinstance(outcome, Result):
+                    yield key, outcome
+                elif outcome == OOM or (outcome is None and memory_limit is not None):
+                    yield key, Result(year, day, part, None, elapsed, status=OOM)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    raise RuntimeError(f"Day {day} part {part} worker exited with code {process.exitcode}")
+
+            if timeout is not None:
+                now = time.perf_counter()
+                for receiver, (process, key, day, part, start) in list(active.items()):
+                    if now - start >= timeout:
+                        del active[receiver]
+                        process.kill()
+                        process.join()
+                        receiver.close()
+                        yield key, Result(year, day, part, None, now - start, status=TIMEOUT)
+    finally:
+        for process, *_ in active.values():
+            process.kill()
+            process.join()
+
+
+def load_timings(year: int, path: Path = TIMINGS_PATH) -> Dict[Tuple[int, int], float]:
+    """Load the wall-clock times recorded by previous runs of a year."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        timings = json.load(f).get(str(year), {})
+
+    estimates = {}
+    for key, elapsed in timings.items():
+        day, part = map(int, key.split('.'))
+        estimates[(day, part)] = elapsed
+    return estimates
+
+
+def save_timings(results: List[Result], path: Path = TIMINGS_PATH):
+    """Record the wall-clock time of every job for scheduling later runs."""
+    path = Path(path)
+    timings = {}
+    if path.exists():
+        with open(path, 'r') as f:
+            timings = json.load(f)
+
+    for result in results:
+        timings.setdefault(str(result.year), {})[f'{result.day}.{result.part}'] = result.elapsed
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+    tmp_path.replace(path)